@@ -769,6 +769,9 @@ async def run_sensor(
         logger.info("Stopping decoy orchestrator...")
         await orchestrator.stop()
 
+        logger.info("Stopping alert dispatcher...")
+        await alert_dispatcher.aclose()
+
         logger.info("Closing database...")
         await db.close()
 
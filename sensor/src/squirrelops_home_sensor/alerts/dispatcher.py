@@ -11,12 +11,14 @@ Built-in method factories:
   - ``create_apns_stub_handler()`` -- no-op placeholder (kept for compat)
 """
 
+import asyncio
 import json
 import logging
+import sys
 from collections.abc import Awaitable, Callable
 from typing import Any, Protocol
 
-from squirrelops_home_sensor.alerts.types import Severity, severity_emoji
+from squirrelops_home_sensor.alerts.types import SEVERITY_RANK, Severity, severity_emoji
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,7 @@ logger = logging.getLogger(__name__)
 
 AlertPayload = dict[str, Any]
 AlertHandler = Callable[[AlertPayload], Awaitable[None]]
+CompiledMethod = tuple[str, AlertHandler, int]
 
 
 class EventBusProtocol(Protocol):
@@ -40,6 +43,7 @@ class MethodConfig:
         self.name: str = config["name"]
         self.handler: AlertHandler = config["handler"]
         self.min_severity: Severity = Severity(config.get("min_severity", "low"))
+        self.threshold: int = SEVERITY_RANK[self.min_severity]
 
     def accepts(self, severity: Severity) -> bool:
         """Return True if this method should receive alerts at the given
@@ -47,6 +51,21 @@ class MethodConfig:
         return severity >= self.min_severity
 
 
+async def close_handler(handler: AlertHandler) -> None:
+    """Release resources (e.g. HTTP sessions) held by a handler, if any."""
+    aclose = getattr(handler, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+def compile_methods(methods: list[dict[str, Any]]) -> tuple[CompiledMethod, ...]:
+    """Resolve method config dicts into ``(name, handler, threshold)`` tuples."""
+    return tuple(
+        (method.name, method.handler, method.threshold)
+        for method in map(MethodConfig, methods)
+    )
+
+
 # -- Alert Dispatcher ------------------------------------------------
 
 class AlertDispatcher:
@@ -61,12 +80,27 @@ class AlertDispatcher:
         - ``min_severity``: minimum severity string (default "low")
     """
 
+    # Event types delivered to the dispatcher; membership is one hash lookup.
+    _subscribed_events: frozenset[str] = frozenset({"alert.new"})
+
     def __init__(self, methods: list[dict[str, Any]]) -> None:
-        self._methods = [MethodConfig(m) for m in methods]
+        self._set_methods(compile_methods(methods))
+
+    def _set_methods(self, methods: tuple[CompiledMethod, ...]) -> None:
+        """Install *methods* and pre-bucket them by the severities they accept.
+
+        ``_by_severity[rank]`` lists the ``(name, handler)`` pairs that fire
+        for an alert of that severity rank, so dispatch does no filtering.
+        """
+        self._methods = methods
+        self._by_severity: tuple[tuple[tuple[str, AlertHandler], ...], ...] = tuple(
+            tuple((name, handler) for name, handler, threshold in methods if rank >= threshold)
+            for rank in range(len(SEVERITY_RANK))
+        )
 
     def subscribe_to(self, event_bus: EventBusProtocol) -> None:
         """Subscribe to ``alert.new`` events on the given event bus."""
-        event_bus.subscribe(["alert.new"], self._on_alert_event)
+        event_bus.subscribe(sorted(self._subscribed_events), self._on_alert_event)
 
     async def _on_alert_event(
         self,
@@ -79,7 +113,11 @@ class AlertDispatcher:
         The production EventBus calls subscribers with one event dict, while
         older tests and lightweight stubs call ``callback(event_type, payload)``.
         Accept both shapes so dispatch is not silently disconnected.
+        Events of other types (e.g. from a wildcard bus) are ignored.
         """
+        event_type = event if isinstance(event, str) else event.get("event_type")
+        if event_type is not None and event_type not in self._subscribed_events:
+            return
         if payload is None:
             if isinstance(event, dict) and isinstance(event.get("payload"), dict):
                 payload = event["payload"]
@@ -90,28 +128,40 @@ class AlertDispatcher:
             return
         await self.dispatch(payload)
 
+    async def aclose(self) -> None:
+        """Close resources (e.g. HTTP sessions) held by the delivery methods."""
+        for _, handler, _ in self._methods:
+            await close_handler(handler)
+
     async def dispatch(self, alert_payload: AlertPayload) -> None:
         """Send the alert to all methods whose severity threshold is met.
 
-        If a method handler raises an exception, the error is logged but
-        dispatch continues to remaining methods (best-effort fan-out).
+        Handlers run concurrently, so a slow webhook does not delay the
+        others.  If a handler raises, the error is logged and the remaining
+        handlers are unaffected (best-effort fan-out).
         """
-        severity = Severity(alert_payload["severity"])
-
-        for method in self._methods:
-            if not method.accepts(severity):
-                continue
-
-            try:
-                await method.handler(alert_payload)
-            except Exception:
-                logger.exception(
+        selected = self._by_severity[SEVERITY_RANK[Severity(alert_payload["severity"])]]
+        if not selected:
+            return
+        results = await asyncio.gather(
+            *(handler(alert_payload) for _, handler in selected),
+            return_exceptions=True,
+        )
+        for (name, _), result in zip(selected, results):
+            if isinstance(result, Exception):
+                logger.error(
                     "Alert dispatch failed for method %s (alert_id=%s)",
-                    method.name,
+                    name,
                     alert_payload.get("alert_id"),
+                    exc_info=result,
                 )
 
 
+# Coalescing window for Slack deliveries built from the live config, so a
+# burst of alerts (e.g. a scan tripping several decoys) becomes one POST.
+SLACK_BATCH_WINDOW_MS = 50
+
+
 def build_methods_from_config(config: dict[str, Any]) -> list[dict[str, Any]]:
     """Build alert delivery methods from the live sensor config."""
     methods: list[dict[str, Any]] = [
@@ -130,6 +180,7 @@ def build_methods_from_config(config: dict[str, Any]) -> list[dict[str, Any]]:
                 "handler": create_slack_handler(
                     webhook_url,
                     include_device_info=bool(slack_cfg.get("include_device_info", False)),
+                    batch_window_ms=SLACK_BATCH_WINDOW_MS,
                 ),
                 "min_severity": slack_cfg.get("min_severity", "low"),
             })
@@ -152,19 +203,54 @@ def build_methods_from_config(config: dict[str, Any]) -> list[dict[str, Any]]:
 
 
 class ConfigurableAlertDispatcher(AlertDispatcher):
-    """Alert dispatcher that resolves delivery methods from live config."""
+    """Alert dispatcher that resolves delivery methods from live config.
+
+    Methods are rebuilt only when the alert-related config changes, so
+    stateful handlers (e.g. Slack batching) persist across dispatches.
+    """
 
     def __init__(self, config: dict[str, Any]) -> None:
         self._config = config
+        self._methods_key: str | None = None
         super().__init__(methods=[])
 
+    def _config_key(self) -> str:
+        return json.dumps(
+            [
+                self._config.get("alert_methods", {}),
+                self._config.get("apns_relay_url"),
+                self._config.get("apns_relay_token"),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
     async def dispatch(self, alert_payload: AlertPayload) -> None:
-        self._methods = [MethodConfig(m) for m in build_methods_from_config(self._config)]
+        key = self._config_key()
+        if key != self._methods_key:
+            stale = self._methods
+            self._set_methods(compile_methods(build_methods_from_config(self._config)))
+            self._methods_key = key
+            for _, handler, _ in stale:
+                await close_handler(handler)
         await super().dispatch(alert_payload)
 
 
 # -- Slack payload formatter -----------------------------------------
 
+# Everything that depends only on severity is built (and interned) once per
+# level: (fallback text prefix, header prefix, severity field text).  The
+# per-alert strings are then a plain concatenation onto these prefixes.
+_SLACK_SEVERITY_TEXT: dict[str, tuple[str, str, str]] = {
+    sev.value: (
+        sys.intern(f"{severity_emoji(sev)} [{sev.value.upper()}] "),
+        sys.intern(f"{severity_emoji(sev)} "),
+        sys.intern(f"*Severity:* {severity_emoji(sev)} {sev.value.upper()}"),
+    )
+    for sev in Severity
+}
+
+
 def format_slack_payload(
     alert_payload: AlertPayload,
     *,
@@ -174,82 +260,44 @@ def format_slack_payload(
 
     Returns a dict suitable for POST-ing to a Slack webhook URL.
     """
-    severity_str = alert_payload["severity"]
-    severity = Severity(severity_str)
-    emoji = severity_emoji(severity)
+    text_prefix, header_prefix, severity_text = _SLACK_SEVERITY_TEXT[
+        alert_payload["severity"]
+    ]
     title = alert_payload["title"]
     detail = alert_payload.get("detail", "")
     source_ip = alert_payload.get("source_ip")
     created_at = alert_payload.get("created_at", "")
     alert_type = alert_payload.get("alert_type", "")
 
-    # Fallback plain text (Slack API requirement)
-    text = f"{emoji} [{severity_str.upper()}] {title}"
+    time_field = {"type": "mrkdwn", "text": f"*Time:* {created_at}"}
 
     # Rich blocks
     blocks: list[dict[str, Any]] = [
         {
             "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": f"{emoji} {title}",
-            },
+            "text": {"type": "plain_text", "text": header_prefix + title},
         },
         {
             "type": "section",
             "fields": [
-                {
-                    "type": "mrkdwn",
-                    "text": f"*Severity:* {emoji} {severity_str.upper()}",
-                },
-                {
-                    "type": "mrkdwn",
-                    "text": f"*Type:* `{alert_type}`",
-                },
+                {"type": "mrkdwn", "text": severity_text},
+                {"type": "mrkdwn", "text": f"*Type:* `{alert_type}`"},
             ],
         },
+        {
+            "type": "section",
+            "fields": (
+                [{"type": "mrkdwn", "text": f"*Source IP:* `{source_ip}`"}, time_field]
+                if source_ip
+                else [time_field]
+            ),
+        },
     ]
 
-    # Source IP field (if present)
-    if source_ip:
-        blocks.append(
-            {
-                "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Source IP:* `{source_ip}`",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Time:* {created_at}",
-                    },
-                ],
-            }
-        )
-    else:
-        blocks.append(
-            {
-                "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Time:* {created_at}",
-                    },
-                ],
-            }
-        )
-
     # Detail
     if detail:
         blocks.append(
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"_{detail}_",
-                },
-            }
+            {"type": "section", "text": {"type": "mrkdwn", "text": f"_{detail}_"}}
         )
 
     # Device identifiers (only if opted in)
@@ -264,16 +312,22 @@ def format_slack_payload(
         if device_fields:
             blocks.append({"type": "section", "fields": device_fields})
 
-    return {"text": text, "blocks": blocks}
+    # Fallback plain text (Slack API requirement)
+    return {"text": text_prefix + title, "blocks": blocks}
 
 
 # -- Built-in handler factories --------------------------------------
 
+_JSON_HEADERS: dict[str, str] = {"Content-Type": "application/json"}
+
+
 def create_slack_handler(
     webhook_url: str,
     *,
     include_device_info: bool = False,
     session_factory: Callable | None = None,
+    batch_window_ms: int = 0,
+    max_batch: int = 8,
 ) -> AlertHandler:
     """Create an async handler that POSTs formatted alerts to a Slack
     webhook URL.
@@ -284,23 +338,106 @@ def create_slack_handler(
         Full Slack incoming webhook URL.
     session_factory:
         Optional callable that returns an async HTTP session (for testing).
-        Defaults to creating an ``aiohttp.ClientSession``.
+        Defaults to creating an ``aiohttp.ClientSession``.  The session is
+        created on first use and reused until ``handler.aclose()``, which
+        first delivers any batched alerts.
+    batch_window_ms:
+        When positive, alerts arriving within this window are coalesced
+        into one Slack message (blocks separated by dividers).  Each call
+        still waits until its batch has been delivered and raises if the
+        POST fails.  ``0`` posts every alert immediately.
+    max_batch:
+        Flush early once this many alerts are pending.  The default keeps
+        a full batch under Slack's 50-block message limit.
     """
+    # Alerts are formatted before they are queued, so a malformed payload
+    # raises in its caller instead of inside the shared flush.
+    pending: list[tuple[dict[str, Any], asyncio.Future[None]]] = []
+    flush_task: asyncio.Task[None] | None = None
+    # Held while a batch is being posted, so close can wait for it.
+    flush_lock = asyncio.Lock()
+    session: Any = None
+
+    async def _post(slack_msg: dict[str, Any]) -> None:
+        # One session per handler: connections (and the TLS handshake to
+        # Slack) are reused across alerts instead of renegotiated each time.
+        nonlocal session
+        if session is None:
+            if session_factory is not None:
+                session = session_factory()
+            else:
+                import aiohttp
+
+                session = aiohttp.ClientSession()
+
+        # Release the response so its connection returns to the pool.
+        async with session.post(
+            webhook_url, data=json.dumps(slack_msg, default=str).encode(), headers=_JSON_HEADERS
+        ) as resp:
+            resp.raise_for_status()
 
-    async def _handler(alert_payload: AlertPayload) -> None:
-        slack_msg = format_slack_payload(alert_payload, include_device_info=include_device_info)
+    async def _aclose() -> None:
+        # Deliver whatever is still batched and let any in-flight POST finish
+        # before the session goes away, so a config reload drops nothing.
+        nonlocal session, flush_task
+        if flush_task is not None:
+            flush_task.cancel()
+            flush_task = None
+        if pending:
+            await _flush()
+        async with flush_lock:
+            if session is not None:
+                await session.close()
+                session = None
+
+    async def _flush() -> None:
+        nonlocal flush_task
+        flush_task = None
+        batch = pending[:]
+        pending.clear()
 
-        if session_factory is not None:
-            session = session_factory()
+        try:
+            blocks: list[dict[str, Any]] = []
+            for msg, _ in batch:
+                if blocks:
+                    blocks.append({"type": "divider"})
+                blocks.extend(msg["blocks"])
+            async with flush_lock:
+                await _post({
+                    "text": "\n".join(msg["text"] for msg, _ in batch),
+                    "blocks": blocks,
+                })
+        except Exception as exc:
+            for _, waiter in batch:
+                if not waiter.done():
+                    waiter.set_exception(exc)
         else:
-            import aiohttp
+            for _, waiter in batch:
+                if not waiter.done():
+                    waiter.set_result(None)
 
-            session = aiohttp.ClientSession()
+    async def _flush_after_window() -> None:
+        await asyncio.sleep(batch_window_ms / 1000)
+        await _flush()
 
-        async with session:
-            resp = await session.post(webhook_url, json=slack_msg)
-            resp.raise_for_status()
+    async def _handler(alert_payload: AlertPayload) -> None:
+        nonlocal flush_task
+        slack_msg = format_slack_payload(alert_payload, include_device_info=include_device_info)
+        if batch_window_ms <= 0:
+            await _post(slack_msg)
+            return
 
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        pending.append((slack_msg, waiter))
+        if len(pending) >= max_batch:
+            if flush_task is not None:
+                flush_task.cancel()
+            await _flush()
+        elif flush_task is None:
+            flush_task = asyncio.create_task(_flush_after_window())
+        await waiter
+
+    _handler.aclose = _aclose  # type: ignore[attr-defined]
     return _handler
 
 
@@ -315,7 +452,12 @@ def create_log_handler(
     log = logging.getLogger(logger_name)
 
     async def _handler(alert_payload: AlertPayload) -> None:
-        log.info(json.dumps(alert_payload, default=str))
+        if not log.isEnabledFor(logging.INFO):
+            return
+        msg = json.dumps(alert_payload, default=str)
+        # The message is already final; skip log.info's caller lookup and
+        # level re-check and hand a prebuilt record straight to the handlers.
+        log.handle(log.makeRecord(log.name, logging.INFO, "", 0, msg, None, None))
 
     return _handler
 
@@ -387,17 +529,18 @@ def create_apns_handler(
     return _handler
 
 
+async def _apns_stub_handler(alert_payload: AlertPayload) -> None:
+    logger.debug(
+        "APNs stub: would send push for alert_id=%s",
+        alert_payload.get("alert_id"),
+    )
+
+
 def create_apns_stub_handler() -> AlertHandler:
     """Create a no-op APNs handler stub.
 
     This is a placeholder for future Apple Push Notification Service
-    integration. It logs the alert at DEBUG level and returns.
+    integration. It logs the alert at DEBUG level and returns.  The
+    handler is stateless, so every call returns the same shared function.
     """
-
-    async def _handler(alert_payload: AlertPayload) -> None:
-        logger.debug(
-            "APNs stub: would send push for alert_id=%s",
-            alert_payload.get("alert_id"),
-        )
-
-    return _handler
+    return _apns_stub_handler
@@ -22,6 +22,24 @@ import aiosqlite
 
 logger = logging.getLogger(__name__)
 
+# Purge statements are module constants so every run passes the identical
+# SQL text, letting sqlite3's per-connection statement cache reuse the
+# prepared statements across daily purges.
+_PURGE_ALERTS_SQL = """DELETE FROM home_alerts
+   WHERE created_at < ?
+     AND (
+         incident_id IS NULL
+         OR incident_id NOT IN (
+             SELECT id FROM incidents WHERE status = 'active'
+         )
+     )"""
+_PURGE_INCIDENTS_SQL = """DELETE FROM incidents
+   WHERE status = 'closed'
+     AND closed_at < ?"""
+_PURGE_EVENTS_SQL = "DELETE FROM events WHERE created_at < ?"
+_PURGE_DECOY_CONNECTIONS_SQL = "DELETE FROM decoy_connections WHERE timestamp < ?"
+_PURGE_CANARY_OBSERVATIONS_SQL = "DELETE FROM canary_observations WHERE observed_at < ?"
+
 
 @dataclass
 class PurgeResult:
@@ -67,6 +85,10 @@ class AlertRetentionService:
     async def purge(self) -> PurgeResult:
         """Execute the retention purge. Returns a summary of purged counts.
 
+        Each table is purged with a single range ``DELETE`` on its timestamp
+        column, and all of them run in one transaction that is committed
+        once at the end.
+
         Order of operations matters -- alerts are purged before incidents
         to respect foreign key relationships.
         """
@@ -82,6 +104,7 @@ class AlertRetentionService:
         result.canary_observations_purged = await self._purge_canary_observations(
             cutoff_str
         )
+        await self._db.commit()
 
         if result.total_purged > 0:
             logger.info(
@@ -100,18 +123,7 @@ class AlertRetentionService:
     async def _purge_alerts(self, cutoff_str: str) -> int:
         """Purge alerts older than cutoff, preserving those linked to
         active incidents."""
-        cursor = await self._db.execute(
-            """DELETE FROM home_alerts
-               WHERE created_at < ?
-                 AND (
-                     incident_id IS NULL
-                     OR incident_id NOT IN (
-                         SELECT id FROM incidents WHERE status = 'active'
-                     )
-                 )""",
-            (cutoff_str,),
-        )
-        await self._db.commit()
+        cursor = await self._db.execute(_PURGE_ALERTS_SQL, (cutoff_str,))
         return cursor.rowcount
 
     async def _purge_incidents(self, cutoff_str: str) -> int:
@@ -120,13 +132,7 @@ class AlertRetentionService:
         Active incidents are never purged regardless of age.
         Child alerts must be purged first (handled by _purge_alerts).
         """
-        cursor = await self._db.execute(
-            """DELETE FROM incidents
-               WHERE status = 'closed'
-                 AND closed_at < ?""",
-            (cutoff_str,),
-        )
-        await self._db.commit()
+        cursor = await self._db.execute(_PURGE_INCIDENTS_SQL, (cutoff_str,))
         return cursor.rowcount
 
     async def _purge_events(self, cutoff_str: str) -> int:
@@ -134,29 +140,17 @@ class AlertRetentionService:
 
         Sequence numbers are never reused (AUTOINCREMENT).
         """
-        cursor = await self._db.execute(
-            "DELETE FROM events WHERE created_at < ?",
-            (cutoff_str,),
-        )
-        await self._db.commit()
+        cursor = await self._db.execute(_PURGE_EVENTS_SQL, (cutoff_str,))
         return cursor.rowcount
 
     async def _purge_decoy_connections(self, cutoff_str: str) -> int:
         """Purge decoy connection records older than cutoff."""
-        cursor = await self._db.execute(
-            "DELETE FROM decoy_connections WHERE timestamp < ?",
-            (cutoff_str,),
-        )
-        await self._db.commit()
+        cursor = await self._db.execute(_PURGE_DECOY_CONNECTIONS_SQL, (cutoff_str,))
         return cursor.rowcount
 
     async def _purge_canary_observations(self, cutoff_str: str) -> int:
         """Purge canary observation records older than cutoff."""
-        cursor = await self._db.execute(
-            "DELETE FROM canary_observations WHERE observed_at < ?",
-            (cutoff_str,),
-        )
-        await self._db.commit()
+        cursor = await self._db.execute(_PURGE_CANARY_OBSERVATIONS_SQL, (cutoff_str,))
         return cursor.rowcount
 
 
@@ -26,7 +26,7 @@ class Severity(enum.Enum):
 
     @property
     def _rank(self) -> int:
-        return _SEVERITY_RANK[self]
+        return SEVERITY_RANK[self]
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Severity):
@@ -42,7 +42,8 @@ class Severity(enum.Enum):
         return hash(self.value)
 
 
-_SEVERITY_RANK: dict[Severity, int] = {
+# Numeric rank per severity, 0 (LOW) .. 3 (CRITICAL).
+SEVERITY_RANK: dict[Severity, int] = {
     Severity.LOW: 0,
     Severity.MEDIUM: 1,
     Severity.HIGH: 2,
@@ -419,6 +419,28 @@ async def _apply_v8(db: aiosqlite.Connection) -> None:
     await db.commit()
 
 
+async def _apply_v9(db: aiosqlite.Connection) -> None:
+    """V9: Index the retention purge predicates.
+
+    The daily retention purge deletes by ``decoy_connections.timestamp``,
+    ``canary_observations.observed_at`` and closed ``incidents.closed_at``;
+    without these indexes each DELETE is a full table scan.
+    """
+    await db.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_conn_timestamp ON decoy_connections(timestamp);
+        CREATE INDEX IF NOT EXISTS idx_canary_observed ON canary_observations(observed_at);
+        CREATE INDEX IF NOT EXISTS idx_incidents_closed
+            ON incidents(closed_at) WHERE status = 'closed';
+    """)
+
+    now = datetime.now(UTC).isoformat()
+    await db.execute(
+        "INSERT OR IGNORE INTO schema_version (version, applied_at) VALUES (?, ?)",
+        (9, now),
+    )
+    await db.commit()
+
+
 # Ordered list of migration functions. Index 0 = migration to version 1.
 _MIGRATIONS: list[tuple[int, callable]] = [
     (1, _apply_v1),
@@ -429,6 +451,7 @@ _MIGRATIONS: list[tuple[int, callable]] = [
     (6, _apply_v6),
     (7, _apply_v7),
     (8, _apply_v8),
+    (9, _apply_v9),
 ]
 
 
@@ -207,23 +207,28 @@ async def list_alerts(
 
 async def mark_alert_read(
     db: aiosqlite.Connection, alert_id: int, *, read_at: str
-) -> None:
-    """Mark an alert as read."""
-    await db.execute(
-        "UPDATE home_alerts SET read_at = ? WHERE id = ?", (read_at, alert_id)
+) -> dict[str, Any] | None:
+    """Mark an alert as read and return the updated row, or None if not found."""
+    row = await _fetchone(
+        db,
+        "UPDATE home_alerts SET read_at = ? WHERE id = ? RETURNING *",
+        (read_at, alert_id),
     )
     await db.commit()
+    return row
 
 
 async def mark_alert_actioned(
     db: aiosqlite.Connection, alert_id: int, *, actioned_at: str
-) -> None:
-    """Mark an alert as actioned."""
-    await db.execute(
-        "UPDATE home_alerts SET actioned_at = ? WHERE id = ?",
+) -> dict[str, Any] | None:
+    """Mark an alert as actioned and return the updated row, or None if not found."""
+    row = await _fetchone(
+        db,
+        "UPDATE home_alerts SET actioned_at = ? WHERE id = ? RETURNING *",
         (actioned_at, alert_id),
     )
     await db.commit()
+    return row
 
 
 # ---------------------------------------------------------------------------
@@ -403,35 +408,43 @@ async def update_decoy_status(
     *,
     status: str,
     updated_at: str,
-) -> None:
-    """Update a decoy's status."""
-    await db.execute(
-        "UPDATE decoys SET status = ?, updated_at = ? WHERE id = ?",
+) -> dict[str, Any] | None:
+    """Update a decoy's status and return the updated row, or None if not found."""
+    row = await _fetchone(
+        db,
+        "UPDATE decoys SET status = ?, updated_at = ? WHERE id = ? RETURNING *",
         (status, updated_at, decoy_id),
     )
     await db.commit()
+    return row
 
 
 async def increment_decoy_connection_count(
     db: aiosqlite.Connection, decoy_id: int
-) -> None:
-    """Increment the connection count for a decoy by 1."""
-    await db.execute(
-        "UPDATE decoys SET connection_count = connection_count + 1 WHERE id = ?",
+) -> dict[str, Any] | None:
+    """Increment the connection count for a decoy by 1 and return the updated row."""
+    row = await _fetchone(
+        db,
+        """UPDATE decoys SET connection_count = connection_count + 1
+           WHERE id = ? RETURNING *""",
         (decoy_id,),
     )
     await db.commit()
+    return row
 
 
 async def increment_decoy_credential_trip_count(
     db: aiosqlite.Connection, decoy_id: int
-) -> None:
-    """Increment the credential trip count for a decoy by 1."""
-    await db.execute(
-        "UPDATE decoys SET credential_trip_count = credential_trip_count + 1 WHERE id = ?",
+) -> dict[str, Any] | None:
+    """Increment the credential trip count for a decoy by 1 and return the updated row."""
+    row = await _fetchone(
+        db,
+        """UPDATE decoys SET credential_trip_count = credential_trip_count + 1
+           WHERE id = ? RETURNING *""",
         (decoy_id,),
     )
     await db.commit()
+    return row
 
 
 # ---------------------------------------------------------------------------
@@ -7,6 +7,7 @@ from alerts.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from squirrelops_home_sensor.alerts.types import Severity
@@ -196,44 +197,83 @@ def issue_key_for_port_risk(finding: PortRisk) -> str:
     return f"port_risk:{service_slug}:{finding.port}"
 
 
+# -- Precomputed per-device-type lookup tables ---------------------------------
+#
+# The rule set is small and fixed, so the set of ports that alert for each
+# device type is computed once at import.  Types not named in any rule fall
+# back to the ``_DEFAULT_*`` buckets (every rule alerts).
+
+_EMPTY: tuple[PortRisk, ...] = ()
+
+_RULES: tuple[PortRisk, ...] = (*ALWAYS_RISKY, *CONTEXT_RISKY)
+_PORT_TO_RULE: dict[int, PortRisk] = {rule.port: rule for rule in _RULES}
+_RULE_RANK: dict[int, int] = {rule.port: rank for rank, rule in enumerate(_RULES)}
+
+_KNOWN_DEVICE_TYPES: frozenset[str] = frozenset().union(
+    *(rule.expected_on for rule in _RULES), ADMIN_EXPECTED_DEVICES,
+)
+
+_DEFAULT_ALERTING_PORTS: frozenset[int] = frozenset(_PORT_TO_RULE)
+_ALERTING_PORTS_BY_TYPE: dict[str, frozenset[int]] = {
+    device_type: frozenset(
+        rule.port for rule in _RULES if device_type not in rule.expected_on
+    )
+    for device_type in _KNOWN_DEVICE_TYPES
+}
+
+_DEFAULT_UNENCRYPTED_TRIGGER: frozenset[int] = UNENCRYPTED_ADMIN_PORTS
+_UNENCRYPTED_TRIGGER_BY_TYPE: dict[str, frozenset[int]] = {
+    device_type: (
+        frozenset() if device_type in ADMIN_EXPECTED_DEVICES
+        else UNENCRYPTED_ADMIN_PORTS
+    )
+    for device_type in _KNOWN_DEVICE_TYPES
+}
+
+
+def _unencrypted_admin_risk(port: int) -> PortRisk:
+    return PortRisk(
+        port=port,
+        service_name=f"Unencrypted admin (port {port})",
+        risk_description=(
+            f"An unencrypted web interface is running on port {port} "
+            f"with no HTTPS alternative. Credentials and data sent to "
+            f"this interface can be intercepted on your network."
+        ),
+        remediation=(
+            "Check if the device supports HTTPS and enable it. If not, "
+            "avoid entering sensitive information through this interface."
+        ),
+        severity=Severity.MEDIUM,
+    )
+
+
 def evaluate_device_ports(
     open_ports: frozenset[int],
     device_type: str,
-) -> list[PortRisk]:
+) -> Sequence[PortRisk]:
     """Evaluate a device's open ports against the risk knowledge base.
 
-    Returns a list of PortRisk objects for ports that are risky given the
-    device's type. Returns an empty list if no risks are found.
+    Returns a sequence of PortRisk objects for ports that are risky given the
+    device's type.  When no risks are found a shared empty tuple is returned,
+    so callers must copy the result before mutating it.
     """
-    findings: list[PortRisk] = []
-
-    for rule in ALWAYS_RISKY:
-        if rule.port in open_ports:
-            findings.append(rule)
-
-    for rule in CONTEXT_RISKY:
-        if rule.port in open_ports and device_type not in rule.expected_on:
-            findings.append(rule)
+    alertable = _ALERTING_PORTS_BY_TYPE.get(
+        device_type, _DEFAULT_ALERTING_PORTS
+    ) & open_ports
 
     # Check for unencrypted admin interfaces on IoT devices
-    if device_type not in ADMIN_EXPECTED_DEVICES:
-        http_ports = open_ports & UNENCRYPTED_ADMIN_PORTS
-        https_ports = open_ports & ENCRYPTED_ADMIN_PORTS
-        if http_ports and not https_ports:
-            for port in sorted(http_ports):
-                findings.append(PortRisk(
-                    port=port,
-                    service_name=f"Unencrypted admin (port {port})",
-                    risk_description=(
-                        f"An unencrypted web interface is running on port {port} "
-                        f"with no HTTPS alternative. Credentials and data sent to "
-                        f"this interface can be intercepted on your network."
-                    ),
-                    remediation=(
-                        "Check if the device supports HTTPS and enable it. If not, "
-                        "avoid entering sensitive information through this interface."
-                    ),
-                    severity=Severity.MEDIUM,
-                ))
+    http_ports = _UNENCRYPTED_TRIGGER_BY_TYPE.get(
+        device_type, _DEFAULT_UNENCRYPTED_TRIGGER
+    ) & open_ports
+    if http_ports and open_ports & ENCRYPTED_ADMIN_PORTS:
+        http_ports = frozenset()
+
+    if not alertable and not http_ports:
+        return _EMPTY
 
+    findings: list[PortRisk] = [
+        _PORT_TO_RULE[port] for port in sorted(alertable, key=_RULE_RANK.__getitem__)
+    ]
+    findings.extend(_unencrypted_admin_risk(port) for port in sorted(http_ports))
     return findings
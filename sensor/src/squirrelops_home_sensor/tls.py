@@ -13,6 +13,7 @@ and LibreSSL (macOS system curl) do not support Ed25519 TLS certificates.
 from __future__ import annotations
 
 import logging
+import os
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -59,6 +60,29 @@ def _pem_to_cert(pem: str) -> x509.Certificate:
     return x509.load_pem_x509_certificate(pem.encode("utf-8"))
 
 
+def _matches_on_disk(path: Path, text: str) -> bool:
+    """Return True if *path* exists and already holds exactly *text*."""
+    try:
+        return path.read_bytes() == text.encode("utf-8")
+    except FileNotFoundError:
+        return False
+
+
+def _write_private(path: Path, text: str) -> None:
+    """Write *text* to *path*, creating the file with mode 0600.
+
+    The mode is applied at creation time so the key is never readable by
+    other users, even briefly.  ``fchmod`` tightens a pre-existing file
+    that was created with looser permissions.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.fchmod(fd, 0o600)
+        os.write(fd, text.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
 # ---------------------------------------------------------------------------
 # Certificate generation
 # ---------------------------------------------------------------------------
@@ -101,6 +125,7 @@ def generate_ca(sensor_name: str) -> tuple[EllipticCurvePrivateKey, x509.Certifi
 def generate_server_cert(
     ca_key: EllipticCurvePrivateKey,
     ca_cert: x509.Certificate,
+    serial_number: int | None = None,
 ) -> tuple[EllipticCurvePrivateKey, x509.Certificate]:
     """Generate a server certificate signed by the sensor CA.
 
@@ -110,6 +135,10 @@ def generate_server_cert(
         The CA private key used to sign the server certificate.
     ca_cert:
         The CA certificate (its subject becomes the issuer of the server cert).
+    serial_number:
+        Explicit certificate serial.  Defaults to a random 159-bit serial
+        from ``x509.random_serial_number()``; tests pass a counter to avoid
+        drawing from the OS entropy pool for every certificate.
 
     Returns
     -------
@@ -127,7 +156,9 @@ def generate_server_cert(
         .subject_name(subject)
         .issuer_name(ca_cert.subject)
         .public_key(server_key.public_key())
-        .serial_number(x509.random_serial_number())
+        .serial_number(
+            serial_number if serial_number is not None else x509.random_serial_number()
+        )
         .not_valid_before(datetime.now(UTC))
         .not_valid_after(datetime.now(UTC) + timedelta(days=_VALIDITY_DAYS))
         .add_extension(x509.BasicConstraints(ca=False, path_length=None), critical=True)
@@ -187,21 +218,29 @@ async def ensure_tls_certs(
 
     existing_ca_key_pem = await store.get("tls.ca_key")  # type: ignore[union-attr]
 
+    # The server material is only ever written to disk, so it stays as PEM
+    # text; just the CA pair is decoded because callers need the objects.
     if existing_ca_key_pem is not None:
         logger.info("Loading existing TLS certificates from secret store")
-        ca_key = _pem_to_key(existing_ca_key_pem)
-        ca_cert = _pem_to_cert(await store.get("tls.ca_cert"))  # type: ignore[arg-type]
-        server_key = _pem_to_key(await store.get("tls.server_key"))  # type: ignore[arg-type]
-        server_cert = _pem_to_cert(await store.get("tls.server_cert"))  # type: ignore[arg-type]
+        ca_key_pem: str = existing_ca_key_pem
+        ca_cert_pem: str = await store.get("tls.ca_cert")  # type: ignore[union-attr]
+        server_key_pem: str = await store.get("tls.server_key")  # type: ignore[union-attr]
+        server_cert_pem: str = await store.get("tls.server_cert")  # type: ignore[union-attr]
+        ca_key = _pem_to_key(ca_key_pem)
+        ca_cert = _pem_to_cert(ca_cert_pem)
     else:
         logger.info("Generating new TLS certificate chain for sensor %r", sensor_name)
         ca_key, ca_cert = generate_ca(sensor_name)
         server_key, server_cert = generate_server_cert(ca_key, ca_cert)
+        ca_key_pem = _key_to_pem(ca_key)
+        ca_cert_pem = _cert_to_pem(ca_cert)
+        server_key_pem = _key_to_pem(server_key)
+        server_cert_pem = _cert_to_pem(server_cert)
 
-        await store.set("tls.ca_key", _key_to_pem(ca_key))  # type: ignore[union-attr]
-        await store.set("tls.ca_cert", _cert_to_pem(ca_cert))  # type: ignore[union-attr]
-        await store.set("tls.server_key", _key_to_pem(server_key))  # type: ignore[union-attr]
-        await store.set("tls.server_cert", _cert_to_pem(server_cert))  # type: ignore[union-attr]
+        await store.set("tls.ca_key", ca_key_pem)  # type: ignore[union-attr]
+        await store.set("tls.ca_cert", ca_cert_pem)  # type: ignore[union-attr]
+        await store.set("tls.server_key", server_key_pem)  # type: ignore[union-attr]
+        await store.set("tls.server_cert", server_cert_pem)  # type: ignore[union-attr]
 
     # Always write PEM files for uvicorn.  The CA file is used by uvicorn
     # when requesting and verifying paired client certificates.
@@ -210,12 +249,18 @@ async def ensure_tls_certs(
     ca_path = data_dir / "ca.crt"
 
     data_dir.mkdir(parents=True, exist_ok=True)
-    cert_path.write_text(_cert_to_pem(server_cert))
-    key_path.write_text(_key_to_pem(server_key))
-    ca_path.write_text(_cert_to_pem(ca_cert))
-    # Restrict key file permissions
-    key_path.chmod(0o600)
-    ca_path.chmod(0o644)
+    # On warm restarts the files usually survive with identical content;
+    # reading them back is cheaper than rewriting them.
+    if not _matches_on_disk(cert_path, server_cert_pem):
+        cert_path.write_text(server_cert_pem)
+    if (
+        not _matches_on_disk(key_path, server_key_pem)
+        or key_path.stat().st_mode & 0o777 != 0o600
+    ):
+        _write_private(key_path, server_key_pem)
+    if not _matches_on_disk(ca_path, ca_cert_pem):
+        ca_path.write_text(ca_cert_pem)
+        ca_path.chmod(0o644)
 
     logger.info("TLS PEM files written to %s", data_dir)
     return cert_path, key_path, ca_key, ca_cert
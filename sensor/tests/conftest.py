@@ -1,13 +1,29 @@
 """Shared test fixtures for SquirrelOps Home Sensor tests."""
 
+import asyncio
 import pathlib
 
 import pytest
 
+# uvloop ships with uvicorn[standard], which serves the sensor in production;
+# it is unavailable on Windows, where tests fall back to the stdlib loop.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 REPO_ROOT = pathlib.Path(__file__).resolve().parents[2]
 SENSOR_ROOT = REPO_ROOT / "sensor"
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop when it is installed, matching production."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
 @pytest.fixture
 def repo_root() -> pathlib.Path:
     return REPO_ROOT
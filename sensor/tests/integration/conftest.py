@@ -1,4 +1,6 @@
 # sensor/tests/integration/conftest.py
+import asyncio
+import copy
 import json
 
 import aiosqlite
@@ -9,14 +11,61 @@ from squirrelops_home_sensor.db.schema import create_all_tables
 from squirrelops_home_sensor.events.bus import EventBus
 from squirrelops_home_sensor.events.log import EventLog
 
+# Modules whose tests write to a shared on-disk path (the config routes persist
+# to ./data/config.yaml). Under ``pytest -n auto --dist loadgroup`` they are
+# pinned to a single worker; everything else runs on per-test :memory:
+# databases and fans out freely.
+_SHARED_FILE_MODULES = frozenset({"test_routes_config.py"})
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        if item.path.name in _SHARED_FILE_MODULES:
+            item.add_marker(pytest.mark.xdist_group("shared-data-dir"))
+
+
+# Connection pragmas shared by every integration-test database. They are all
+# throwaway :memory: databases, so durability is irrelevant.
+_TEST_PRAGMAS = """
+PRAGMA journal_mode = MEMORY;
+PRAGMA synchronous = OFF;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -64000;
+PRAGMA foreign_keys = ON;
+"""
+
+
+async def apply_test_pragmas(conn, *, foreign_keys=True):
+    """Apply the shared test pragmas to a fresh connection.
+
+    Pass ``foreign_keys=False`` for tests that insert child rows without
+    their parents.
+    """
+    await conn.executescript(_TEST_PRAGMAS)
+    if not foreign_keys:
+        await conn.execute("PRAGMA foreign_keys = OFF")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _schema_db():
+    """In-memory database with the full schema, built once per session."""
+    conn = await aiosqlite.connect(":memory:")
+    await create_all_tables(conn)
+    yield conn
+    await conn.close()
+
 
 @pytest_asyncio.fixture
-async def db():
-    """Create an in-memory SQLite database with full schema."""
+async def db(_schema_db):
+    """Create an in-memory SQLite database with full schema.
+
+    The schema is cloned from ``_schema_db`` with ``backup()`` rather than
+    re-running every CREATE and migration per test.
+    """
     conn = await aiosqlite.connect(":memory:")
     conn.row_factory = aiosqlite.Row
-    await conn.execute("PRAGMA foreign_keys = ON")
-    await create_all_tables(conn)
+    await apply_test_pragmas(conn)
+    await _schema_db.backup(conn)
     yield conn
     await conn.close()
 
@@ -29,9 +78,9 @@ def event_bus(db):
     return bus
 
 
-@pytest.fixture
-def sensor_config():
-    """Return a test sensor configuration dict."""
+@pytest.fixture(scope="session")
+def _sensor_config_template():
+    """Build the test sensor configuration once per session."""
     return {
         "sensor_id": "test-sensor-001",
         "sensor_name": "SquirrelOps-TEST",
@@ -52,6 +101,16 @@ def sensor_config():
     }
 
 
+@pytest.fixture
+def sensor_config(_sensor_config_template):
+    """Return a test sensor configuration dict.
+
+    A deep copy of the session template: the config routes and several
+    tests mutate the dict in place, so it must not be shared between tests.
+    """
+    return copy.deepcopy(_sensor_config_template)
+
+
 @pytest.fixture
 def app(db, event_bus, sensor_config):
     """Create a FastAPI app with dependency overrides for testing."""
@@ -92,6 +151,17 @@ def client(app):
     return TestClient(app)
 
 
+@pytest_asyncio.fixture
+async def async_client(app):
+    """Create an httpx AsyncClient that calls the app on the test's event loop."""
+    import httpx
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
 async def seed_devices(db, count=3):
     """Insert test devices into the database. Returns list of device IDs."""
     ids = []
@@ -270,3 +340,8 @@ async def seed_pairing(db):
     )
     await db.commit()
     return cursor.lastrowid
+
+
+async def wait_for_event(evt, timeout=1.0):
+    """Wait for *evt* to be set, failing the test after *timeout* seconds."""
+    await asyncio.wait_for(evt.wait(), timeout=timeout)
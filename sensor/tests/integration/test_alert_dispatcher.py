@@ -7,13 +7,26 @@ Each method can have a minimum severity threshold.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
+from collections.abc import Iterator
+from types import MappingProxyType
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from squirrelops_home_sensor.alerts import dispatcher as dispatcher_mod
+from squirrelops_home_sensor.alerts.dispatcher import (
+    AlertDispatcher,
+    create_apns_stub_handler,
+    create_log_handler,
+    create_slack_handler,
+    format_slack_payload,
+)
+
 # -- Lightweight event bus stub --------------------------------------
 
 class StubEventBus:
@@ -21,19 +34,87 @@ class StubEventBus:
 
     def __init__(self) -> None:
         self.published: list[tuple[str, dict[str, Any]]] = []
-        self._subscribers: dict[str, list[Any]] = {}
+        # Buckets are immutable tuples; subscribe replaces a bucket by copy.
+        self._subscribers: dict[str, tuple[Any, ...]] = {}
+        # event_type -> (exact subscribers, wildcard subscribers)
+        self._resolved: dict[str, tuple[tuple[Any, ...], tuple[Any, ...]]] = {}
 
     async def publish(self, event_type: str, payload: dict[str, Any]) -> int:
         self.published.append((event_type, payload))
-        for cb in self._subscribers.get(event_type, []):
+        resolved = self._resolved.get(event_type)
+        if resolved is None:
+            resolved = self._resolved[event_type] = (
+                self._subscribers.get(event_type, ()),
+                self._subscribers.get("*", ()),
+            )
+        exact, wildcard = resolved
+        for cb in exact:
             await cb(event_type, payload)
-        for cb in self._subscribers.get("*", []):
+        for cb in wildcard:
             await cb(event_type, payload)
         return len(self.published)
 
     def subscribe(self, event_types: list[str], callback: Any) -> None:
         for et in event_types:
-            self._subscribers.setdefault(et, []).append(callback)
+            self._subscribers[et] = (*self._subscribers.get(et, ()), callback)
+        self._resolved.clear()
+
+
+# -- Lightweight handler stub ----------------------------------------
+
+class _Recorder:
+    """Async alert handler that records the payloads it receives.
+
+    Mirrors the small slice of ``AsyncMock`` these tests use, without the
+    ``unittest.mock`` bookkeeping.
+    """
+
+    def __init__(self, side_effect: Exception | None = None) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self._side_effect = side_effect
+
+    async def __call__(self, payload: dict[str, Any]) -> None:
+        self.calls.append(payload)
+        if self._side_effect is not None:
+            raise self._side_effect
+
+    def assert_awaited_once(self) -> None:
+        assert len(self.calls) == 1, f"expected 1 call, got {len(self.calls)}"
+
+    def assert_not_awaited(self) -> None:
+        assert not self.calls, f"expected no calls, got {len(self.calls)}"
+
+
+def _mock_slack_session(post_error: Exception | None = None) -> MagicMock:
+    """HTTP session whose ``post()`` is an async context manager, like aiohttp's."""
+    response = MagicMock()
+    request = MagicMock()
+    request.__aenter__ = AsyncMock(return_value=response, side_effect=post_error)
+    request.__aexit__ = AsyncMock(return_value=False)
+    session = MagicMock()
+    session.post = MagicMock(return_value=request)
+    session.close = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def recorder() -> type[_Recorder]:
+    """Factory for recording alert handlers."""
+    return _Recorder
+
+
+@pytest.fixture(scope="module")
+def base_alert() -> MappingProxyType[str, Any]:
+    """Canonical decoy-trip alert payload; derive variants with ``{**base_alert, ...}``."""
+    return MappingProxyType({
+        "alert_id": 1,
+        "alert_type": "decoy.trip",
+        "severity": "high",
+        "title": "Decoy tripped",
+        "detail": "Connection to fake-nas:8445",
+        "source_ip": "192.168.1.99",
+        "created_at": "2026-02-22T10:00:00.000Z",
+    })
 
 
 # -- Tests -----------------------------------------------------------
@@ -43,11 +124,9 @@ class TestFanOut:
     """Dispatcher fans out alerts to all configured methods."""
 
     @pytest.mark.asyncio
-    async def test_dispatches_to_slack_and_log(self):
-        from squirrelops_home_sensor.alerts.dispatcher import AlertDispatcher
-
-        mock_slack = AsyncMock()
-        mock_log = AsyncMock()
+    async def test_dispatches_to_slack_and_log(self, recorder, base_alert):
+        mock_slack = recorder()
+        mock_log = recorder()
 
         dispatcher = AlertDispatcher(
             methods=[
@@ -56,33 +135,21 @@ class TestFanOut:
             ]
         )
 
-        alert_payload = {
-            "alert_id": 1,
-            "alert_type": "decoy.trip",
-            "severity": "high",
-            "title": "Decoy tripped",
-            "detail": "Connection to fake-nas:8445",
-            "source_ip": "192.168.1.99",
-            "created_at": "2026-02-22T10:00:00.000Z",
-        }
-
-        await dispatcher.dispatch(alert_payload)
+        await dispatcher.dispatch(base_alert)
 
         mock_slack.assert_awaited_once()
         mock_log.assert_awaited_once()
 
         # Both handlers receive the same payload
-        slack_call_payload = mock_slack.call_args[0][0]
+        slack_call_payload = mock_slack.calls[0]
         assert slack_call_payload["alert_type"] == "decoy.trip"
-        log_call_payload = mock_log.call_args[0][0]
+        log_call_payload = mock_log.calls[0]
         assert log_call_payload["alert_type"] == "decoy.trip"
 
     @pytest.mark.asyncio
-    async def test_dispatches_to_all_methods_even_if_one_fails(self):
-        from squirrelops_home_sensor.alerts.dispatcher import AlertDispatcher
-
-        mock_slack = AsyncMock(side_effect=Exception("Slack is down"))
-        mock_log = AsyncMock()
+    async def test_dispatches_to_all_methods_even_if_one_fails(self, recorder, base_alert):
+        mock_slack = recorder(side_effect=Exception("Slack is down"))
+        mock_log = recorder()
 
         dispatcher = AlertDispatcher(
             methods=[
@@ -91,32 +158,51 @@ class TestFanOut:
             ]
         )
 
-        alert_payload = {
+        # Should not raise even though Slack fails
+        await dispatcher.dispatch(base_alert)
+
+        mock_slack.assert_awaited_once()
+        mock_log.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_handlers_run_concurrently(self):
+        log_started = asyncio.Event()
+        completed: list[str] = []
+
+        async def slow_slack(payload):
+            # Only completes if the log handler starts while Slack is pending
+            await asyncio.wait_for(log_started.wait(), timeout=0.5)
+            completed.append("slack")
+
+        async def log(payload):
+            log_started.set()
+            completed.append("log")
+
+        dispatcher = AlertDispatcher(
+            methods=[
+                {"name": "slack", "handler": slow_slack, "min_severity": "low"},
+                {"name": "log", "handler": log, "min_severity": "low"},
+            ]
+        )
+
+        await dispatcher.dispatch({
             "alert_id": 1,
             "alert_type": "decoy.trip",
             "severity": "high",
             "title": "Decoy tripped",
-            "detail": "Connection to fake-nas:8445",
-            "source_ip": "192.168.1.99",
             "created_at": "2026-02-22T10:00:00.000Z",
-        }
-
-        # Should not raise even though Slack fails
-        await dispatcher.dispatch(alert_payload)
+        })
 
-        mock_slack.assert_awaited_once()
-        mock_log.assert_awaited_once()
+        assert completed == ["log", "slack"]
 
 
 class TestSeverityFiltering:
     """Each method can have a minimum severity threshold."""
 
     @pytest.mark.asyncio
-    async def test_filters_below_minimum_severity(self):
-        from squirrelops_home_sensor.alerts.dispatcher import AlertDispatcher
-
-        mock_slack = AsyncMock()
-        mock_log = AsyncMock()
+    async def test_filters_below_minimum_severity(self, recorder, base_alert):
+        mock_slack = recorder()
+        mock_log = recorder()
 
         dispatcher = AlertDispatcher(
             methods=[
@@ -126,13 +212,12 @@ class TestSeverityFiltering:
         )
 
         alert_payload = {
-            "alert_id": 1,
+            **base_alert,
             "alert_type": "device.new",
             "severity": "medium",
             "title": "New device detected",
             "detail": "Unknown device appeared",
             "source_ip": "192.168.1.50",
-            "created_at": "2026-02-22T10:00:00.000Z",
         }
 
         await dispatcher.dispatch(alert_payload)
@@ -143,10 +228,8 @@ class TestSeverityFiltering:
         mock_log.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_dispatches_at_exact_threshold(self):
-        from squirrelops_home_sensor.alerts.dispatcher import AlertDispatcher
-
-        mock_slack = AsyncMock()
+    async def test_dispatches_at_exact_threshold(self, recorder, base_alert):
+        mock_slack = recorder()
 
         dispatcher = AlertDispatcher(
             methods=[
@@ -154,25 +237,15 @@ class TestSeverityFiltering:
             ]
         )
 
-        alert_payload = {
-            "alert_id": 1,
-            "alert_type": "decoy.trip",
-            "severity": "high",
-            "title": "Decoy tripped",
-            "detail": "Probe detected",
-            "source_ip": "192.168.1.99",
-            "created_at": "2026-02-22T10:00:00.000Z",
-        }
+        alert_payload = {**base_alert, "detail": "Probe detected"}
 
         await dispatcher.dispatch(alert_payload)
 
         mock_slack.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_critical_always_dispatched(self):
-        from squirrelops_home_sensor.alerts.dispatcher import AlertDispatcher
-
-        mock_slack = AsyncMock()
+    async def test_critical_always_dispatched(self, recorder, base_alert):
+        mock_slack = recorder()
 
         dispatcher = AlertDispatcher(
             methods=[
@@ -181,23 +254,19 @@ class TestSeverityFiltering:
         )
 
         alert_payload = {
-            "alert_id": 1,
+            **base_alert,
             "alert_type": "decoy.credential_trip",
             "severity": "critical",
             "title": "Credential used",
             "detail": "passwords.txt downloaded",
-            "source_ip": "192.168.1.99",
-            "created_at": "2026-02-22T10:00:00.000Z",
         }
 
         await dispatcher.dispatch(alert_payload)
         mock_slack.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_low_alert_blocked_by_medium_threshold(self):
-        from squirrelops_home_sensor.alerts.dispatcher import AlertDispatcher
-
-        mock_handler = AsyncMock()
+    async def test_low_alert_blocked_by_medium_threshold(self, recorder, base_alert):
+        mock_handler = recorder()
 
         dispatcher = AlertDispatcher(
             methods=[
@@ -206,33 +275,53 @@ class TestSeverityFiltering:
         )
 
         alert_payload = {
-            "alert_id": 1,
+            **base_alert,
             "alert_type": "system.learning_complete",
             "severity": "low",
             "title": "Learning complete",
             "detail": "48-hour learning period finished",
             "source_ip": None,
-            "created_at": "2026-02-22T10:00:00.000Z",
         }
 
         await dispatcher.dispatch(alert_payload)
         mock_handler.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_unknown_severity_raises_value_error(self, recorder, base_alert):
+        dispatcher = AlertDispatcher(
+            methods=[
+                {"name": "test", "handler": recorder(), "min_severity": "low"},
+            ]
+        )
+
+        with pytest.raises(ValueError):
+            await dispatcher.dispatch({**base_alert, "severity": "urgent"})
+
+
+def _walk_strings(obj: Any) -> Iterator[str]:
+    """Yield every string nested anywhere in a Slack message structure."""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from _walk_strings(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _walk_strings(value)
+
 
 class TestSlackPayload:
     """Slack handler produces correctly formatted payloads."""
 
     @pytest.mark.asyncio
-    async def test_slack_payload_format_critical(self):
-        from squirrelops_home_sensor.alerts.dispatcher import format_slack_payload
-
+    async def test_slack_payload_format_critical(self, base_alert):
         alert_payload = {
+            **base_alert,
             "alert_id": 42,
             "alert_type": "decoy.credential_trip",
             "severity": "critical",
             "title": "Credential used on file share",
             "detail": "passwords.txt downloaded from fake-nas",
-            "source_ip": "192.168.1.99",
             "created_at": "2026-02-22T10:15:30.000Z",
         }
 
@@ -248,17 +337,15 @@ class TestSlackPayload:
         assert len(blocks) >= 1
 
         # Verify severity emoji is in the header
-        block_text = json.dumps(blocks, ensure_ascii=False)
-        assert "\U0001f534" in block_text  # red circle for critical
+        assert any("\U0001f534" in t for t in _walk_strings(blocks[0]))  # red circle
 
         # Verify source IP is present
-        assert "192.168.1.99" in block_text
+        assert any("192.168.1.99" in t for t in _walk_strings(blocks))
 
     @pytest.mark.asyncio
-    async def test_slack_payload_format_low(self):
-        from squirrelops_home_sensor.alerts.dispatcher import format_slack_payload
-
+    async def test_slack_payload_format_low(self, base_alert):
         alert_payload = {
+            **base_alert,
             "alert_id": 7,
             "alert_type": "system.learning_complete",
             "severity": "low",
@@ -271,88 +358,155 @@ class TestSlackPayload:
         slack_msg = format_slack_payload(alert_payload)
 
         assert "text" in slack_msg
-        block_text = json.dumps(slack_msg["blocks"], ensure_ascii=False)
-        assert "\U0001f535" in block_text  # blue circle for low
+        header = slack_msg["blocks"][0]
+        assert any("\U0001f535" in t for t in _walk_strings(header))  # blue circle for low
 
     @pytest.mark.asyncio
-    async def test_slack_payload_includes_timestamp(self):
-        from squirrelops_home_sensor.alerts.dispatcher import format_slack_payload
-
+    async def test_slack_payload_includes_timestamp(self, base_alert):
         alert_payload = {
-            "alert_id": 1,
-            "alert_type": "decoy.trip",
-            "severity": "high",
-            "title": "Decoy tripped",
+            **base_alert,
             "detail": "Connection detected",
-            "source_ip": "192.168.1.99",
             "created_at": "2026-02-22T10:15:30.000Z",
         }
 
         slack_msg = format_slack_payload(alert_payload)
-        block_text = json.dumps(slack_msg["blocks"])
-        assert "2026-02-22" in block_text
+        assert any("2026-02-22" in t for t in _walk_strings(slack_msg["blocks"]))
 
 
 class TestSlackHandler:
     """Slack handler sends POST request to webhook URL."""
 
     @pytest.mark.asyncio
-    async def test_slack_handler_posts_to_webhook(self):
-        from squirrelops_home_sensor.alerts.dispatcher import create_slack_handler
-
+    async def test_slack_handler_posts_to_webhook(self, base_alert):
         webhook_url = "https://hooks.slack.com/services/T00/B00/XXXX"
 
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.raise_for_status = MagicMock()
-
-        mock_session = AsyncMock()
-        mock_session.post = AsyncMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=False)
+        mock_session = _mock_slack_session()
 
         handler = create_slack_handler(
             webhook_url, session_factory=lambda: mock_session
         )
 
-        alert_payload = {
-            "alert_id": 1,
-            "alert_type": "decoy.trip",
-            "severity": "high",
-            "title": "Decoy tripped",
-            "detail": "Connection to fake-nas",
-            "source_ip": "192.168.1.99",
-            "created_at": "2026-02-22T10:00:00.000Z",
-        }
+        alert_payload = {**base_alert, "detail": "Connection to fake-nas"}
 
         await handler(alert_payload)
 
-        mock_session.post.assert_awaited_once()
+        mock_session.post.assert_called_once()
         call_args = mock_session.post.call_args
         assert call_args[0][0] == webhook_url
-        posted_json = call_args[1]["json"]
+        assert call_args[1]["headers"]["Content-Type"] == "application/json"
+        posted_json = json.loads(call_args[1]["data"])
         assert "text" in posted_json
         assert "blocks" in posted_json
 
+    @pytest.mark.asyncio
+    async def test_slack_handler_reuses_session_across_alerts(self, base_alert):
+        mock_session = _mock_slack_session()
+        session_factory = MagicMock(return_value=mock_session)
+
+        handler = create_slack_handler(
+            "https://hooks.slack.com/services/T00/B00/XXXX",
+            session_factory=session_factory,
+        )
+
+        await handler(base_alert)
+        await handler(base_alert)
+
+        session_factory.assert_called_once()
+        assert mock_session.post.call_count == 2
+        mock_session.close.assert_not_awaited()
+
+        await handler.aclose()
+        mock_session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_slack_handler_coalesces_burst_into_one_post(self):
+        mock_session = _mock_slack_session()
+
+        handler = create_slack_handler(
+            "https://hooks.slack.com/services/T00/B00/XXXX",
+            session_factory=lambda: mock_session,
+            batch_window_ms=10,
+        )
+
+        await asyncio.gather(
+            handler({"severity": "high", "title": "First", "created_at": "2026-02-22"}),
+            handler({"severity": "low", "title": "Second", "created_at": "2026-02-22"}),
+        )
+
+        mock_session.post.assert_called_once()
+        posted_json = json.loads(mock_session.post.call_args[1]["data"])
+        assert "First" in posted_json["text"]
+        assert "Second" in posted_json["text"]
+        assert {"type": "divider"} in posted_json["blocks"]
+
+    @pytest.mark.asyncio
+    async def test_slack_handler_batch_failure_raises_for_each_alert(self):
+        mock_session = _mock_slack_session(post_error=RuntimeError("Slack is down"))
+
+        handler = create_slack_handler(
+            "https://hooks.slack.com/services/T00/B00/XXXX",
+            session_factory=lambda: mock_session,
+            batch_window_ms=10,
+        )
+
+        results = await asyncio.gather(
+            handler({"severity": "high", "title": "First"}),
+            handler({"severity": "high", "title": "Second"}),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_slack_handler_malformed_alert_does_not_stall_batch(self):
+        mock_session = _mock_slack_session()
+
+        handler = create_slack_handler(
+            "https://hooks.slack.com/services/T00/B00/XXXX",
+            session_factory=lambda: mock_session,
+            batch_window_ms=10,
+        )
+
+        bad, good = await asyncio.wait_for(
+            asyncio.gather(
+                handler({"severity": "high"}),  # no title
+                handler({"severity": "high", "title": "Good"}),
+                return_exceptions=True,
+            ),
+            timeout=1.0,
+        )
+
+        assert isinstance(bad, KeyError)
+        assert good is None
+        mock_session.post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_slack_handler_aclose_flushes_pending_alerts(self):
+        mock_session = _mock_slack_session()
+
+        handler = create_slack_handler(
+            "https://hooks.slack.com/services/T00/B00/XXXX",
+            session_factory=lambda: mock_session,
+            batch_window_ms=1000,
+        )
+
+        pending = asyncio.ensure_future(handler({"severity": "high", "title": "Late"}))
+        await asyncio.sleep(0)
+        await handler.aclose()
+
+        await asyncio.wait_for(pending, timeout=1.0)
+        mock_session.post.assert_called_once()
+        mock_session.close.assert_awaited_once()
+
 
 class TestLogHandler:
     """Log handler writes structured JSON to the configured logger."""
 
     @pytest.mark.asyncio
-    async def test_log_handler_writes_json(self, caplog):
-        from squirrelops_home_sensor.alerts.dispatcher import create_log_handler
-
+    async def test_log_handler_writes_json(self, caplog, base_alert):
         handler = create_log_handler(logger_name="squirrelops.alerts.test")
 
-        alert_payload = {
-            "alert_id": 1,
-            "alert_type": "decoy.trip",
-            "severity": "high",
-            "title": "Decoy tripped",
-            "detail": "Connection to fake-nas:8445",
-            "source_ip": "192.168.1.99",
-            "created_at": "2026-02-22T10:00:00.000Z",
-        }
+        alert_payload = dict(base_alert)
 
         with caplog.at_level(logging.INFO, logger="squirrelops.alerts.test"):
             await handler(alert_payload)
@@ -366,16 +520,23 @@ class TestLogHandler:
         assert logged["severity"] == "high"
         assert logged["source_ip"] == "192.168.1.99"
 
+    @pytest.mark.asyncio
+    async def test_log_handler_skips_when_info_disabled(self, caplog, base_alert):
+        handler = create_log_handler(logger_name="squirrelops.alerts.test")
+
+        with caplog.at_level(logging.WARNING, logger="squirrelops.alerts.test"):
+            await handler(dict(base_alert))
+
+        assert caplog.records == []
+
 
 class TestEventBusIntegration:
     """Dispatcher can subscribe to event bus and auto-dispatch."""
 
     @pytest.mark.asyncio
-    async def test_subscribes_to_alert_new_events(self):
-        from squirrelops_home_sensor.alerts.dispatcher import AlertDispatcher
-
+    async def test_subscribes_to_alert_new_events(self, recorder, base_alert):
         event_bus = StubEventBus()
-        mock_handler = AsyncMock()
+        mock_handler = recorder()
 
         dispatcher = AlertDispatcher(
             methods=[
@@ -385,26 +546,13 @@ class TestEventBusIntegration:
 
         dispatcher.subscribe_to(event_bus)
 
-        await event_bus.publish(
-            "alert.new",
-            {
-                "alert_id": 1,
-                "alert_type": "decoy.trip",
-                "severity": "high",
-                "title": "Decoy tripped",
-                "detail": "Connection",
-                "source_ip": "192.168.1.99",
-                "created_at": "2026-02-22T10:00:00.000Z",
-            },
-        )
+        await event_bus.publish("alert.new", {**base_alert, "detail": "Connection"})
 
         mock_handler.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_accepts_production_event_bus_shape(self):
-        from squirrelops_home_sensor.alerts.dispatcher import AlertDispatcher
-
-        mock_handler = AsyncMock()
+    async def test_accepts_production_event_bus_shape(self, recorder):
+        mock_handler = recorder()
         dispatcher = AlertDispatcher(
             methods=[
                 {"name": "test", "handler": mock_handler, "min_severity": "low"},
@@ -427,11 +575,9 @@ class TestEventBusIntegration:
         mock_handler.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_ignores_non_alert_events(self):
-        from squirrelops_home_sensor.alerts.dispatcher import AlertDispatcher
-
+    async def test_ignores_non_alert_events(self, recorder):
         event_bus = StubEventBus()
-        mock_handler = AsyncMock()
+        mock_handler = recorder()
 
         dispatcher = AlertDispatcher(
             methods=[
@@ -448,25 +594,96 @@ class TestEventBusIntegration:
 
         mock_handler.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_ignores_non_alert_events_from_wildcard_subscription(self, recorder):
+        event_bus = StubEventBus()
+        mock_handler = recorder()
+
+        dispatcher = AlertDispatcher(
+            methods=[
+                {"name": "test", "handler": mock_handler, "min_severity": "low"},
+            ]
+        )
+        event_bus.subscribe(["*"], dispatcher._on_alert_event)
+
+        await event_bus.publish(
+            "device.discovered",
+            {"device_id": 5, "ip": "192.168.1.10", "severity": "low"},
+        )
+
+        mock_handler.assert_not_awaited()
+
+
+class TestConfigurableDispatcher:
+    """Config-driven dispatcher reuses handlers while config is unchanged."""
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_methods_only_when_config_changes(self):
+        config = {"alert_methods": {"log": {"enabled": True}}}
+        dispatcher = dispatcher_mod.ConfigurableAlertDispatcher(config)
+        alert_payload = {"alert_id": 1, "severity": "low", "title": "Learning complete"}
+
+        with patch.object(
+            dispatcher_mod,
+            "build_methods_from_config",
+            wraps=dispatcher_mod.build_methods_from_config,
+        ) as build:
+            await dispatcher.dispatch(alert_payload)
+            await dispatcher.dispatch(alert_payload)
+            assert build.call_count == 1
+
+            config["alert_methods"]["slack"] = {"enabled": False}
+            await dispatcher.dispatch(alert_payload)
+            assert build.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_config_change_delivers_alerts_batched_by_old_handler(self, monkeypatch):
+        mock_session = _mock_slack_session()
+        monkeypatch.setattr(
+            dispatcher_mod,
+            "create_slack_handler",
+            functools.partial(
+                dispatcher_mod.create_slack_handler, session_factory=lambda: mock_session
+            ),
+        )
+        slack_cfg = {"enabled": True, "webhook_url": "https://hooks.slack.com/old"}
+        dispatcher = dispatcher_mod.ConfigurableAlertDispatcher(
+            {"alert_methods": {"slack": slack_cfg}}
+        )
+
+        # The first alert is still waiting in the old handler's batch window
+        # when the webhook URL changes.
+        first = asyncio.ensure_future(
+            dispatcher.dispatch({"alert_id": 1, "severity": "high", "title": "First"})
+        )
+        await asyncio.sleep(0)
+        slack_cfg["webhook_url"] = "https://hooks.slack.com/new"
+        await dispatcher.dispatch({"alert_id": 2, "severity": "high", "title": "Second"})
+        await asyncio.wait_for(first, timeout=1.0)
+
+        assert [c.args[0] for c in mock_session.post.call_args_list] == [
+            "https://hooks.slack.com/old",
+            "https://hooks.slack.com/new",
+        ]
+
 
 class TestApnsStub:
     """APNs handler is a no-op stub for now."""
 
     @pytest.mark.asyncio
-    async def test_apns_stub_does_not_raise(self):
-        from squirrelops_home_sensor.alerts.dispatcher import create_apns_stub_handler
-
+    async def test_apns_stub_does_not_raise(self, base_alert):
         handler = create_apns_stub_handler()
 
         alert_payload = {
-            "alert_id": 1,
+            **base_alert,
             "alert_type": "decoy.credential_trip",
             "severity": "critical",
             "title": "Credential used",
             "detail": "passwords.txt downloaded",
-            "source_ip": "192.168.1.99",
-            "created_at": "2026-02-22T10:00:00.000Z",
         }
 
         # Should complete without error
         await handler(alert_payload)
+
+    def test_apns_stub_factory_returns_shared_handler(self):
+        assert create_apns_stub_handler() is create_apns_stub_handler()
@@ -1,14 +1,44 @@
 """Integration tests for FastAPI app factory, DI, and auth middleware."""
-import asyncio
-
+import httpx
+import pytest
+import pytest_asyncio
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 
 from squirrelops_home_sensor import __version__
 from squirrelops_home_sensor.api.deps import get_config, get_db, get_event_bus, verify_client_cert
 from squirrelops_home_sensor.app import create_app
 
 
+@pytest.fixture
+def app_no_auth_override(db, event_bus, sensor_config):
+    """App with db/event bus/config overridden but real client cert verification."""
+    application = create_app(sensor_config)
+
+    async def override_db():
+        yield db
+
+    async def override_event_bus():
+        return event_bus
+
+    async def override_config():
+        return sensor_config
+
+    application.dependency_overrides[get_db] = override_db
+    application.dependency_overrides[get_event_bus] = override_event_bus
+    application.dependency_overrides[get_config] = override_config
+    # verify_client_cert is NOT overridden — protected routes should reject
+    return application
+
+
+@pytest_asyncio.fixture
+async def no_auth_client(app_no_auth_override):
+    """HTTP client for ``app_no_auth_override``."""
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app_no_auth_override), base_url="http://test"
+    ) as client:
+        yield client
+
+
 class TestAppFactory:
     """Test that create_app produces a working FastAPI application."""
 
@@ -56,97 +86,25 @@ class TestDependencyInjection:
 class TestAuthMiddleware:
     """Test TLS client cert verification."""
 
-    def test_authenticated_route_returns_200_with_valid_auth(self, client, db):
+    async def test_authenticated_route_returns_200_with_valid_auth(self, async_client, db):
         """Routes requiring auth should succeed when auth dependency is overridden."""
-        asyncio.get_event_loop().run_until_complete(
-            db.execute(
-                """INSERT INTO devices (ip_address, mac_address, hostname, vendor, device_type,
-                   first_seen, last_seen, is_online)
-                   VALUES ('192.168.1.1', 'AA:BB:CC:DD:EE:01', 'test', 'Test', 'unknown',
-                   '2026-02-22T00:00:00Z', '2026-02-22T00:00:00Z', 1)"""
-            )
+        await db.execute(
+            """INSERT INTO devices (ip_address, mac_address, hostname, vendor, device_type,
+               first_seen, last_seen, is_online)
+               VALUES ('192.168.1.1', 'AA:BB:CC:DD:EE:01', 'test', 'Test', 'unknown',
+               '2026-02-22T00:00:00Z', '2026-02-22T00:00:00Z', 1)"""
         )
-        asyncio.get_event_loop().run_until_complete(db.commit())
-        response = client.get("/devices")
+        await db.commit()
+        response = await async_client.get("/devices")
         assert response.status_code == 200
 
-    def test_unauthenticated_route_returns_403(self, sensor_config):
+    async def test_unauthenticated_route_returns_403(self, no_auth_client):
         """Without auth override, protected routes should return 403."""
-        app = create_app(sensor_config)
-        import aiosqlite
-
-        from squirrelops_home_sensor.db.schema import create_all_tables
-
-        _db = None
-
-        async def setup_db():
-            nonlocal _db
-            _db = await aiosqlite.connect(":memory:")
-            _db.row_factory = aiosqlite.Row
-            await _db.execute("PRAGMA foreign_keys = ON")
-            await create_all_tables(_db)
-
-        asyncio.run(setup_db())
-
-        async def override_db():
-            yield _db
-
-        async def override_event_bus():
-            from squirrelops_home_sensor.events.bus import EventBus
-            from squirrelops_home_sensor.events.log import EventLog
-            return EventBus(EventLog(_db))
-
-        async def override_config():
-            return sensor_config
-
-        app.dependency_overrides[get_db] = override_db
-        app.dependency_overrides[get_event_bus] = override_event_bus
-        app.dependency_overrides[get_config] = override_config
-        # verify_client_cert is NOT overridden — it should reject
-
-        client = TestClient(app)
-        response = client.get("/devices")
+        response = await no_auth_client.get("/devices")
         assert response.status_code == 403
 
-        asyncio.run(_db.close())
-
-    def test_pairing_routes_skip_auth(self, sensor_config):
+    async def test_pairing_routes_skip_auth(self, no_auth_client):
         """Pairing routes must be accessible without client cert auth."""
-        app = create_app(sensor_config)
-
-        import aiosqlite
-
-        from squirrelops_home_sensor.db.schema import create_all_tables
-
-        _db = None
-
-        async def setup_db():
-            nonlocal _db
-            _db = await aiosqlite.connect(":memory:")
-            _db.row_factory = aiosqlite.Row
-            await _db.execute("PRAGMA foreign_keys = ON")
-            await create_all_tables(_db)
-
-        asyncio.run(setup_db())
-
-        async def override_db():
-            yield _db
-
-        async def override_event_bus():
-            from squirrelops_home_sensor.events.bus import EventBus
-            from squirrelops_home_sensor.events.log import EventLog
-            return EventBus(EventLog(_db))
-
-        async def override_config():
-            return sensor_config
-
-        app.dependency_overrides[get_db] = override_db
-        app.dependency_overrides[get_event_bus] = override_event_bus
-        app.dependency_overrides[get_config] = override_config
-
-        client = TestClient(app)
-        response = client.get("/pairing/code/challenge")
+        response = await no_auth_client.get("/pairing/code/challenge")
         # Should not be 403 — pairing routes do not require client cert auth
         assert response.status_code != 403
-
-        asyncio.run(_db.close())
@@ -4,24 +4,11 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock
 
-import aiosqlite
 import pytest
 
-from squirrelops_home_sensor.db.schema import create_all_tables
 from squirrelops_home_sensor.decoys.orchestrator import DecoyOrchestrator
 
 
-@pytest.fixture()
-async def db(tmp_path):
-    """Create an in-memory database with schema."""
-    db_path = tmp_path / "test.db"
-    conn = await aiosqlite.connect(str(db_path))
-    conn.row_factory = aiosqlite.Row
-    await create_all_tables(conn)
-    yield conn
-    await conn.close()
-
-
 @pytest.fixture()
 def event_bus():
     bus = MagicMock()
@@ -2,35 +2,35 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from operator import itemgetter
+
 import aiosqlite
 import pytest
+import pytest_asyncio
 
 from squirrelops_home_sensor.db.migrations import apply_migrations
 from squirrelops_home_sensor.db.schema import (
     SCHEMA_VERSION,
     get_all_table_names,
 )
+from tests.integration.conftest import apply_test_pragmas
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-async def _get_tables(db: aiosqlite.Connection) -> set[str]:
-    """Return the set of user table names in the database."""
-    cursor = await db.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
-    )
-    rows = await cursor.fetchall()
-    return {row[0] for row in rows}
-
-
-async def _get_indexes(db: aiosqlite.Connection) -> set[str]:
-    """Return the set of user index names in the database."""
+async def _missing_objects(
+    db: aiosqlite.Connection, obj_type: str, expected: frozenset[str]
+) -> frozenset[str]:
+    """Return the names in ``expected`` with no ``obj_type`` entry in sqlite_master."""
+    placeholders = ", ".join("?" * len(expected))
     cursor = await db.execute(
-        "SELECT name FROM sqlite_master WHERE type='index' AND name NOT LIKE 'sqlite_%'"
+        f"SELECT name FROM sqlite_master WHERE type = ? AND name IN ({placeholders})",
+        (obj_type, *expected),
     )
     rows = await cursor.fetchall()
-    return {row[0] for row in rows}
+    return expected.difference(map(itemgetter(0), rows))
 
 
 async def _get_schema_version(db: aiosqlite.Connection) -> int:
@@ -40,13 +40,14 @@ async def _get_schema_version(db: aiosqlite.Connection) -> int:
     return row[0] if row and row[0] is not None else 0
 
 
-async def _table_has_column(
-    db: aiosqlite.Connection, table: str, column: str
-) -> bool:
-    """Check whether a table has a specific column."""
-    cursor = await db.execute(f"PRAGMA table_info({table})")
-    rows = await cursor.fetchall()
-    return any(row[1] == column for row in rows)
+async def _get_column_set(db: aiosqlite.Connection, table: str) -> set[str]:
+    """Return the set of column names in a table.
+
+    Read from the result description of an empty SELECT, so no rows are
+    stepped through.
+    """
+    cursor = await db.execute(f"SELECT * FROM {table} LIMIT 0")
+    return {desc[0] for desc in cursor.description}
 
 
 async def _get_foreign_keys(
@@ -59,43 +60,92 @@ async def _get_foreign_keys(
     return [(row[3], row[2], row[4]) for row in rows]
 
 
+@asynccontextmanager
+async def _new_test_db():
+    """Open an empty in-memory database with the test pragmas applied."""
+    async with aiosqlite.connect(":memory:") as db:
+        await apply_test_pragmas(db)
+        yield db
+
+
+@asynccontextmanager
+async def _rolled_back(db: aiosqlite.Connection, *, foreign_keys: bool = True):
+    """Run a block inside a SAVEPOINT that is rolled back on exit.
+
+    Lets tests that write rows share the class's migrated database. Pass
+    ``foreign_keys=False`` to disable enforcement for the block; the pragma
+    is a no-op inside a transaction, so it is toggled around the savepoint.
+    """
+    if not foreign_keys:
+        await db.execute("PRAGMA foreign_keys = OFF")
+    await db.execute("SAVEPOINT test")
+    try:
+        yield
+    finally:
+        await db.execute("ROLLBACK TO test")
+        await db.execute("RELEASE test")
+        if not foreign_keys:
+            await db.execute("PRAGMA foreign_keys = ON")
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def _migrated_template():
+    """Empty database migrated once by ``apply_migrations`` for the module."""
+    async with _new_test_db() as db:
+        await apply_migrations(db)
+        yield db
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def migrated_db(_migrated_template: aiosqlite.Connection):
+    """Migrated in-memory database shared by a class.
+
+    Cloned page-for-page from ``_migrated_template`` with ``backup()`` rather
+    than re-running the migrations. Tests that write must do so inside
+    ``_rolled_back()``.
+    """
+    async with _new_test_db() as db:
+        await _migrated_template.backup(db)
+        yield db
+
+
 # ---------------------------------------------------------------------------
 # Tests: Fresh database creation
 # ---------------------------------------------------------------------------
 
+EXPECTED_TABLES = frozenset({
+    "events",
+    "device_fingerprints",
+    "device_trust",
+    "incidents",
+    "home_alerts",
+    "decoys",
+    "planted_credentials",
+    "decoy_connections",
+    "pairing",
+    "canary_observations",
+    "schema_version",
+})
+
+
 class TestFreshDatabase:
     """Test creating the schema on a brand-new empty database."""
 
     @pytest.mark.asyncio
-    async def test_apply_migrations_creates_all_tables(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-
-            tables = await _get_tables(db)
-            expected = {
-                "events",
-                "device_fingerprints",
-                "device_trust",
-                "incidents",
-                "home_alerts",
-                "decoys",
-                "planted_credentials",
-                "decoy_connections",
-                "pairing",
-                "canary_observations",
-                "schema_version",
-            }
-            for table in expected:
-                assert table in tables, f"Missing table: {table}"
+    async def test_apply_migrations_creates_all_tables(
+        self, migrated_db: aiosqlite.Connection
+    ) -> None:
+        missing = await _missing_objects(migrated_db, "table", EXPECTED_TABLES)
+        assert not missing, f"Missing tables: {missing}"
 
     @pytest.mark.asyncio
-    async def test_schema_version_is_set(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            version = await _get_schema_version(db)
-            assert version == SCHEMA_VERSION
+    async def test_schema_version_is_set(self, migrated_db: aiosqlite.Connection) -> None:
+        version = await _get_schema_version(migrated_db)
+        assert version == SCHEMA_VERSION
 
     @pytest.mark.asyncio
     async def test_all_table_names_helper(self) -> None:
@@ -107,8 +157,7 @@ class TestFreshDatabase:
     @pytest.mark.asyncio
     async def test_idempotent_migration(self) -> None:
         """Running apply_migrations twice should not raise or duplicate data."""
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
+        async with _new_test_db() as db:
             await apply_migrations(db)
             await apply_migrations(db)
             version = await _get_schema_version(db)
@@ -119,314 +168,180 @@ class TestFreshDatabase:
 # Tests: Table structures
 # ---------------------------------------------------------------------------
 
+# Columns each table must have after all migrations; later migrations may add more
+TABLE_COLUMNS: dict[str, frozenset[str]] = {
+    "events": frozenset({
+        "seq", "event_type", "payload", "source_id", "created_at",
+    }),
+    "device_fingerprints": frozenset({
+        "id", "device_id", "mac_address", "mdns_hostname", "dhcp_fingerprint_hash",
+        "connection_pattern_hash", "open_ports_hash", "composite_hash", "signal_count",
+        "confidence", "first_seen", "last_seen",
+    }),
+    "device_trust": frozenset({
+        "device_id", "status", "approved_by", "updated_at",
+    }),
+    "incidents": frozenset({
+        "id", "source_ip", "source_mac", "status", "severity", "alert_count",
+        "first_alert_at", "last_alert_at", "closed_at", "summary",
+    }),
+    "home_alerts": frozenset({
+        "id", "incident_id", "alert_type", "severity", "title", "detail", "source_ip",
+        "source_mac", "device_id", "decoy_id", "read_at", "actioned_at", "event_seq",
+        "created_at",
+    }),
+    "decoys": frozenset({
+        "id", "name", "decoy_type", "bind_address", "port", "status", "config",
+        "connection_count", "credential_trip_count", "failure_count", "last_failure_at",
+        "created_at", "updated_at",
+    }),
+    "planted_credentials": frozenset({
+        "id", "credential_type", "credential_value", "canary_hostname", "planted_location",
+        "decoy_id", "tripped", "first_tripped_at", "created_at",
+    }),
+    "decoy_connections": frozenset({
+        "id", "decoy_id", "source_ip", "source_mac", "port", "protocol", "request_path",
+        "credential_used", "credential_id", "event_seq", "timestamp",
+    }),
+    "pairing": frozenset({
+        "id", "client_name", "client_cert_fingerprint", "is_local", "paired_at",
+        "last_connected_at",
+    }),
+    "canary_observations": frozenset({
+        "id", "credential_id", "canary_hostname", "queried_by_ip", "queried_by_mac",
+        "event_seq", "observed_at",
+    }),
+}
+
+
+class TestTableColumns:
+    """Verify every table carries its required columns."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("table", "expected"), list(TABLE_COLUMNS.items()), ids=list(TABLE_COLUMNS)
+    )
+    async def test_has_required_columns(
+        self, migrated_db: aiosqlite.Connection, table: str, expected: frozenset[str]
+    ) -> None:
+        missing = expected - await _get_column_set(migrated_db, table)
+        assert not missing, f"{table} missing columns: {missing}"
+
+
 class TestEventsTable:
     """Verify the events table structure."""
 
     @pytest.mark.asyncio
-    async def test_events_has_autoincrement_pk(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            # Insert and verify autoincrement behavior
-            await db.execute(
-                "INSERT INTO events (event_type, payload) VALUES ('test', '{}')"
+    async def test_insert_assigns_seq_and_created_at(
+        self, migrated_db: aiosqlite.Connection
+    ) -> None:
+        """seq autoincrements from 1 and created_at defaults when omitted."""
+        async with _rolled_back(migrated_db):
+            await migrated_db.executemany(
+                "INSERT INTO events (event_type, payload) VALUES (?, '{}')",
+                [("test",), ("test2",)],
             )
-            await db.execute(
-                "INSERT INTO events (event_type, payload) VALUES ('test2', '{}')"
+            cursor = await migrated_db.execute(
+                "SELECT seq, created_at FROM events ORDER BY seq"
             )
-            cursor = await db.execute("SELECT seq FROM events ORDER BY seq")
             rows = await cursor.fetchall()
-            assert rows[0][0] == 1
-            assert rows[1][0] == 2
-
-    @pytest.mark.asyncio
-    async def test_events_has_required_columns(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            for col in ["seq", "event_type", "payload", "source_id", "created_at"]:
-                assert await _table_has_column(db, "events", col), (
-                    f"events missing column: {col}"
-                )
-
-    @pytest.mark.asyncio
-    async def test_events_created_at_default(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            await db.execute(
-                "INSERT INTO events (event_type, payload) VALUES ('test', '{}')"
-            )
-            cursor = await db.execute("SELECT created_at FROM events WHERE seq = 1")
-            row = await cursor.fetchone()
-            assert row is not None
-            assert row[0] is not None  # Default should have populated
-
-
-class TestDeviceFingerprintsTable:
-    """Verify the device_fingerprints table structure."""
-
-    @pytest.mark.asyncio
-    async def test_has_required_columns(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            expected_cols = [
-                "id", "device_id", "mac_address", "mdns_hostname",
-                "dhcp_fingerprint_hash", "connection_pattern_hash",
-                "open_ports_hash", "composite_hash", "signal_count",
-                "confidence", "first_seen", "last_seen",
-            ]
-            for col in expected_cols:
-                assert await _table_has_column(db, "device_fingerprints", col), (
-                    f"device_fingerprints missing column: {col}"
-                )
-
-
-class TestDeviceTrustTable:
-    """Verify the device_trust table structure."""
-
-    @pytest.mark.asyncio
-    async def test_has_required_columns(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            for col in ["device_id", "status", "approved_by", "updated_at"]:
-                assert await _table_has_column(db, "device_trust", col)
-
-    @pytest.mark.asyncio
-    async def test_status_check_constraint(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = OFF")
-            await apply_migrations(db)
-            with pytest.raises(Exception):
-                await db.execute(
-                    "INSERT INTO device_trust (device_id, status, updated_at) "
-                    "VALUES (1, 'invalid_status', '2025-01-01T00:00:00Z')"
-                )
-
-
-class TestIncidentsTable:
-    """Verify the incidents table structure."""
+            assert [row[0] for row in rows] == [1, 2]
+            assert all(row[1] is not None for row in rows)
+
+
+# Inserts that each violate exactly one CHECK constraint
+BAD_INSERTS: dict[str, str] = {
+    "device_trust_status": (
+        "INSERT INTO device_trust (device_id, status, updated_at) "
+        "VALUES (1, 'invalid_status', '2025-01-01T00:00:00Z')"
+    ),
+    "incidents_status": (
+        "INSERT INTO incidents (source_ip, status, severity, "
+        "first_alert_at, last_alert_at) "
+        "VALUES ('1.2.3.4', 'bogus', 'high', '2025-01-01', '2025-01-01')"
+    ),
+    "incidents_severity": (
+        "INSERT INTO incidents (source_ip, status, severity, "
+        "first_alert_at, last_alert_at) "
+        "VALUES ('1.2.3.4', 'active', 'bogus', '2025-01-01', '2025-01-01')"
+    ),
+    "decoys_status": (
+        "INSERT INTO decoys (name, decoy_type, bind_address, port, "
+        "status, created_at, updated_at) "
+        "VALUES ('test', 'dev_server', '0.0.0.0', 3000, "
+        "'bogus', '2025-01-01', '2025-01-01')"
+    ),
+}
+
+
+class TestCheckConstraints:
+    """Verify CHECK constraints reject out-of-range enum values."""
 
     @pytest.mark.asyncio
-    async def test_has_required_columns(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            expected = [
-                "id", "source_ip", "source_mac", "status", "severity",
-                "alert_count", "first_alert_at", "last_alert_at",
-                "closed_at", "summary",
-            ]
-            for col in expected:
-                assert await _table_has_column(db, "incidents", col)
-
-    @pytest.mark.asyncio
-    async def test_status_check_constraint(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = OFF")
-            await apply_migrations(db)
-            with pytest.raises(Exception):
-                await db.execute(
-                    "INSERT INTO incidents (source_ip, status, severity, "
-                    "first_alert_at, last_alert_at) "
-                    "VALUES ('1.2.3.4', 'bogus', 'high', '2025-01-01', '2025-01-01')"
-                )
-
-    @pytest.mark.asyncio
-    async def test_severity_check_constraint(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = OFF")
-            await apply_migrations(db)
-            with pytest.raises(Exception):
-                await db.execute(
-                    "INSERT INTO incidents (source_ip, status, severity, "
-                    "first_alert_at, last_alert_at) "
-                    "VALUES ('1.2.3.4', 'active', 'bogus', '2025-01-01', '2025-01-01')"
-                )
-
-
-class TestHomeAlertsTable:
-    """Verify the home_alerts table structure."""
-
-    @pytest.mark.asyncio
-    async def test_has_required_columns(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            expected = [
-                "id", "incident_id", "alert_type", "severity", "title",
-                "detail", "source_ip", "source_mac", "device_id",
-                "decoy_id", "read_at", "actioned_at", "event_seq", "created_at",
-            ]
-            for col in expected:
-                assert await _table_has_column(db, "home_alerts", col)
-
-    @pytest.mark.asyncio
-    async def test_foreign_key_to_incidents(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            fks = await _get_foreign_keys(db, "home_alerts")
-            fk_tables = [fk[1] for fk in fks]
-            assert "incidents" in fk_tables
-
-
-class TestDecoysTable:
-    """Verify the decoys table structure."""
-
-    @pytest.mark.asyncio
-    async def test_has_required_columns(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            expected = [
-                "id", "name", "decoy_type", "bind_address", "port",
-                "status", "config", "connection_count",
-                "credential_trip_count", "failure_count",
-                "last_failure_at", "created_at", "updated_at",
-            ]
-            for col in expected:
-                assert await _table_has_column(db, "decoys", col)
-
-    @pytest.mark.asyncio
-    async def test_status_check_constraint(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = OFF")
-            await apply_migrations(db)
-            with pytest.raises(Exception):
-                await db.execute(
-                    "INSERT INTO decoys (name, decoy_type, bind_address, port, "
-                    "status, created_at, updated_at) "
-                    "VALUES ('test', 'dev_server', '0.0.0.0', 3000, "
-                    "'bogus', '2025-01-01', '2025-01-01')"
-                )
-
-
-class TestPlantedCredentialsTable:
-    """Verify the planted_credentials table structure."""
-
-    @pytest.mark.asyncio
-    async def test_has_required_columns(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            expected = [
-                "id", "credential_type", "credential_value",
-                "canary_hostname", "planted_location", "decoy_id",
-                "tripped", "first_tripped_at", "created_at",
-            ]
-            for col in expected:
-                assert await _table_has_column(db, "planted_credentials", col)
-
-    @pytest.mark.asyncio
-    async def test_foreign_key_to_decoys(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            fks = await _get_foreign_keys(db, "planted_credentials")
-            fk_tables = [fk[1] for fk in fks]
-            assert "decoys" in fk_tables
-
-
-class TestDecoyConnectionsTable:
-    """Verify the decoy_connections table structure."""
+    @pytest.mark.parametrize("sql", list(BAD_INSERTS.values()), ids=list(BAD_INSERTS))
+    async def test_check_constraint_rejects(
+        self, migrated_db: aiosqlite.Connection, sql: str
+    ) -> None:
+        # FK enforcement off so only the CHECK constraint can reject the row
+        async with _rolled_back(migrated_db, foreign_keys=False):
+            with pytest.raises(aiosqlite.IntegrityError, match="CHECK constraint"):
+                await migrated_db.execute(sql)
 
-    @pytest.mark.asyncio
-    async def test_has_required_columns(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            expected = [
-                "id", "decoy_id", "source_ip", "source_mac", "port",
-                "protocol", "request_path", "credential_used",
-                "credential_id", "event_seq", "timestamp",
-            ]
-            for col in expected:
-                assert await _table_has_column(db, "decoy_connections", col)
 
-    @pytest.mark.asyncio
-    async def test_foreign_key_to_decoys(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            fks = await _get_foreign_keys(db, "decoy_connections")
-            fk_tables = [fk[1] for fk in fks]
-            assert "decoys" in fk_tables
+# (table, referenced table) pairs that must be declared as foreign keys
+FOREIGN_KEYS = [
+    ("home_alerts", "incidents"),
+    ("planted_credentials", "decoys"),
+    ("decoy_connections", "decoys"),
+    ("canary_observations", "planted_credentials"),
+]
 
 
-class TestPairingTable:
-    """Verify the pairing table structure."""
+class TestForeignKeys:
+    """Verify tables reference their parent tables."""
 
     @pytest.mark.asyncio
-    async def test_has_required_columns(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            expected = [
-                "id", "client_name", "client_cert_fingerprint",
-                "is_local", "paired_at", "last_connected_at",
-            ]
-            for col in expected:
-                assert await _table_has_column(db, "pairing", col)
-
-
-class TestCanaryObservationsTable:
-    """Verify the canary_observations table structure."""
-
-    @pytest.mark.asyncio
-    async def test_has_required_columns(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            expected = [
-                "id", "credential_id", "canary_hostname",
-                "queried_by_ip", "queried_by_mac", "event_seq", "observed_at",
-            ]
-            for col in expected:
-                assert await _table_has_column(db, "canary_observations", col)
-
-    @pytest.mark.asyncio
-    async def test_foreign_key_to_planted_credentials(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            fks = await _get_foreign_keys(db, "canary_observations")
-            fk_tables = [fk[1] for fk in fks]
-            assert "planted_credentials" in fk_tables
+    @pytest.mark.parametrize(
+        ("table", "target"), FOREIGN_KEYS, ids=[f"{t}-{r}" for t, r in FOREIGN_KEYS]
+    )
+    async def test_foreign_key(
+        self, migrated_db: aiosqlite.Connection, table: str, target: str
+    ) -> None:
+        fks = await _get_foreign_keys(migrated_db, table)
+        assert target in {fk[1] for fk in fks}
 
 
 # ---------------------------------------------------------------------------
 # Tests: Indexes
 # ---------------------------------------------------------------------------
 
+EXPECTED_INDEXES = frozenset({
+    "idx_events_type",
+    "idx_events_created",
+    "idx_fp_device",
+    "idx_fp_composite",
+    "idx_incidents_source",
+    "idx_incidents_active",
+    "idx_alerts_severity",
+    "idx_alerts_type",
+    "idx_alerts_created",
+    "idx_alerts_incident",
+    "idx_alerts_unread",
+    "idx_creds_canary",
+    "idx_creds_value",
+    "idx_conn_decoy",
+    "idx_conn_source",
+    "idx_canary_hostname",
+    "idx_conn_timestamp",
+    "idx_canary_observed",
+    "idx_incidents_closed",
+})
+
+
 class TestIndexes:
     """Verify all expected indexes are created."""
 
     @pytest.mark.asyncio
-    async def test_all_indexes_created(self) -> None:
-        async with aiosqlite.connect(":memory:") as db:
-            await db.execute("PRAGMA foreign_keys = ON")
-            await apply_migrations(db)
-            indexes = await _get_indexes(db)
-            expected_indexes = {
-                "idx_events_type",
-                "idx_events_created",
-                "idx_fp_device",
-                "idx_fp_composite",
-                "idx_incidents_source",
-                "idx_incidents_active",
-                "idx_alerts_severity",
-                "idx_alerts_type",
-                "idx_alerts_created",
-                "idx_alerts_incident",
-                "idx_alerts_unread",
-                "idx_creds_canary",
-                "idx_creds_value",
-                "idx_conn_decoy",
-                "idx_conn_source",
-                "idx_canary_hostname",
-            }
-            for idx in expected_indexes:
-                assert idx in indexes, f"Missing index: {idx}"
+    async def test_all_indexes_created(self, migrated_db: aiosqlite.Connection) -> None:
+        missing = await _missing_objects(migrated_db, "index", EXPECTED_INDEXES)
+        assert not missing, f"Missing indexes: {missing}"
@@ -10,9 +10,7 @@ import json
 from typing import Any
 from unittest.mock import AsyncMock
 
-import aiosqlite
 import pytest
-import pytest_asyncio
 
 from squirrelops_home_sensor.alerts.decoy_handler import DecoyAlertHandler
 from squirrelops_home_sensor.alerts.types import AlertType, Severity
@@ -51,17 +49,6 @@ class FakeEventBus:
 
 # -- Fixtures --------------------------------------------------------------
 
-@pytest_asyncio.fixture
-async def db():
-    conn = await aiosqlite.connect(":memory:")
-    conn.row_factory = aiosqlite.Row
-    await conn.execute("PRAGMA foreign_keys = ON")
-    from squirrelops_home_sensor.db.schema import create_all_tables
-    await create_all_tables(conn)
-    yield conn
-    await conn.close()
-
-
 @pytest.fixture
 def bus():
     return FakeEventBus()
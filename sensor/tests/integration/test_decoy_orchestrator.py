@@ -68,74 +68,27 @@ class TestDecoySelection:
         db = AsyncMock()
         return DecoyOrchestrator(event_bus=event_bus, db=db, max_decoys=8)
 
-    def test_dev_server_selected_for_dev_ports(self, orchestrator):
-        """Ports 3000, 3001, 5173, 8000, 8080 should trigger dev server decoy."""
-        services = [
-            {"ip": "192.168.1.10", "port": 3000, "protocol": "tcp"},
-        ]
-        candidates = orchestrator.select_decoys(
-            discovered_services=services,
-            mdns_services=set(),
-        )
-        types = [c["decoy_type"] for c in candidates]
-        assert "dev_server" in types
-
-    def test_home_assistant_selected_for_mdns(self, orchestrator):
-        """_home-assistant._tcp mDNS should trigger HA decoy."""
-        services = []
-        mdns = {"_home-assistant._tcp"}
+    @pytest.mark.parametrize(
+        ("services", "mdns", "expected"),
+        [
+            # Ports 3000, 3001, 5173, 8000, 8080 trigger the dev server decoy
+            ([{"ip": "192.168.1.10", "port": 3000, "protocol": "tcp"}], set(), "dev_server"),
+            ([], {"_home-assistant._tcp"}, "home_assistant"),
+            ([{"ip": "192.168.1.20", "port": 8123, "protocol": "tcp"}], set(), "home_assistant"),
+            ([{"ip": "192.168.1.30", "port": 445, "protocol": "tcp"}], set(), "file_share"),
+            ([{"ip": "192.168.1.30", "port": 548, "protocol": "tcp"}], set(), "file_share"),
+            # With nothing detected, a file share decoy is still selected
+            ([], set(), "file_share"),
+        ],
+        ids=["dev_port", "ha_mdns", "ha_port_8123", "smb_port", "afp_port", "fallback"],
+    )
+    def test_selects_decoy_type(self, orchestrator, services, mdns, expected):
+        """Each detected service should yield a candidate of the matching type."""
         candidates = orchestrator.select_decoys(
             discovered_services=services,
             mdns_services=mdns,
         )
-        types = [c["decoy_type"] for c in candidates]
-        assert "home_assistant" in types
-
-    def test_home_assistant_selected_for_port_8123(self, orchestrator):
-        """Port 8123 should trigger HA decoy."""
-        services = [
-            {"ip": "192.168.1.20", "port": 8123, "protocol": "tcp"},
-        ]
-        candidates = orchestrator.select_decoys(
-            discovered_services=services,
-            mdns_services=set(),
-        )
-        types = [c["decoy_type"] for c in candidates]
-        assert "home_assistant" in types
-
-    def test_file_share_selected_for_smb_port(self, orchestrator):
-        """Port 445 (SMB) should trigger file share decoy."""
-        services = [
-            {"ip": "192.168.1.30", "port": 445, "protocol": "tcp"},
-        ]
-        candidates = orchestrator.select_decoys(
-            discovered_services=services,
-            mdns_services=set(),
-        )
-        types = [c["decoy_type"] for c in candidates]
-        assert "file_share" in types
-
-    def test_file_share_selected_for_afp_port(self, orchestrator):
-        """Port 548 (AFP) should trigger file share decoy."""
-        services = [
-            {"ip": "192.168.1.30", "port": 548, "protocol": "tcp"},
-        ]
-        candidates = orchestrator.select_decoys(
-            discovered_services=services,
-            mdns_services=set(),
-        )
-        types = [c["decoy_type"] for c in candidates]
-        assert "file_share" in types
-
-    def test_fallback_file_share_when_nothing_detected(self, orchestrator):
-        """With no detected services, a file share decoy should still be selected."""
-        candidates = orchestrator.select_decoys(
-            discovered_services=[],
-            mdns_services=set(),
-        )
-        assert len(candidates) >= 1
-        types = [c["decoy_type"] for c in candidates]
-        assert "file_share" in types
+        assert expected in {c["decoy_type"] for c in candidates}
 
     def test_multiple_types_selected(self, orchestrator):
         """Multiple service types should produce multiple decoy candidates."""
@@ -207,7 +160,6 @@ class TestDeployment:
         db = AsyncMock()
         return DecoyOrchestrator(event_bus=event_bus, db=db, max_decoys=8)
 
-    @pytest.mark.asyncio
     async def test_deploy_starts_decoy(self, orchestrator):
         """deploy_decoy should call start() on the decoy."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -215,28 +167,24 @@ class TestDeployment:
         assert decoy.start_count == 1
         assert decoy.is_running
 
-    @pytest.mark.asyncio
     async def test_deploy_tracks_decoy(self, orchestrator):
         """Deployed decoy should appear in orchestrator's active list."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
         await orchestrator.deploy_decoy(decoy)
         assert orchestrator.get_decoy(1) is not None
 
-    @pytest.mark.asyncio
     async def test_deploy_publishes_event(self, orchestrator):
         """Deploying a decoy should publish a decoy.health_changed event."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
         await orchestrator.deploy_decoy(decoy)
         orchestrator._event_bus.publish.assert_called()
 
-    @pytest.mark.asyncio
     async def test_deploy_sets_connection_callback(self, orchestrator):
         """Deployed decoy should have its connection callback set."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
         await orchestrator.deploy_decoy(decoy)
         assert decoy.on_connection is not None
 
-    @pytest.mark.asyncio
     async def test_stop_all(self, orchestrator):
         """stop_all() should stop all deployed decoys."""
         d1 = FakeDecoy(decoy_id=1, name="d1", port=9001)
@@ -262,7 +210,6 @@ class TestHealthStateMachine:
         db = AsyncMock()
         return DecoyOrchestrator(event_bus=event_bus, db=db, max_decoys=8)
 
-    @pytest.mark.asyncio
     async def test_initial_state_is_active(self, orchestrator):
         """After deployment, health state should be ACTIVE."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -270,7 +217,6 @@ class TestHealthStateMachine:
         record = orchestrator.get_decoy(1)
         assert record.health == DecoyHealth.ACTIVE
 
-    @pytest.mark.asyncio
     async def test_crash_triggers_restart(self, orchestrator):
         """A failed health check should trigger restart attempt."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -285,7 +231,6 @@ class TestHealthStateMachine:
         # Should have attempted restart
         assert decoy.start_count >= 2  # initial start + restart
 
-    @pytest.mark.asyncio
     async def test_successful_restart_returns_to_active(self, orchestrator):
         """After a successful restart, state should return to ACTIVE."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -302,7 +247,6 @@ class TestHealthStateMachine:
         record = orchestrator.get_decoy(1)
         assert record.health == DecoyHealth.ACTIVE
 
-    @pytest.mark.asyncio
     async def test_three_failures_within_window_degrades(self, orchestrator):
         """3 failures within 5 minutes should transition to DEGRADED."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -318,7 +262,6 @@ class TestHealthStateMachine:
         record = orchestrator.get_decoy(1)
         assert record.health == DecoyHealth.DEGRADED
 
-    @pytest.mark.asyncio
     async def test_manual_restart_resets_failure_count(self, orchestrator):
         """Manual restart should reset failure count and return to ACTIVE."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -353,7 +296,6 @@ class TestConnectionHandler:
         db = AsyncMock()
         return DecoyOrchestrator(event_bus=event_bus, db=db, max_decoys=8)
 
-    @pytest.mark.asyncio
     async def test_connection_publishes_trip_event(self, orchestrator):
         """A decoy connection should publish a decoy.trip event."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -378,7 +320,6 @@ class TestConnectionHandler:
         trip_calls = [c for c in calls if c[0][0] == "decoy.trip"]
         assert len(trip_calls) >= 1
 
-    @pytest.mark.asyncio
     async def test_credential_trip_publishes_credential_event(self, orchestrator):
         """A connection with credential_used should publish decoy.credential_trip."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -403,7 +344,6 @@ class TestConnectionHandler:
         payload = cred_calls[0][0][1]
         assert payload["credential_used"] == "AKIA1234567890ABCDEF"
 
-    @pytest.mark.asyncio
     async def test_connection_without_credential_no_credential_event(self, orchestrator):
         """A connection without credential_used should NOT publish decoy.credential_trip."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -440,7 +380,6 @@ class TestDegradationRecovery:
         db = AsyncMock()
         return DecoyOrchestrator(event_bus=event_bus, db=db, max_decoys=8)
 
-    @pytest.mark.asyncio
     async def test_degraded_decoy_tracked(self, orchestrator):
         """Degraded decoys should remain in the orchestrator's records."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -455,7 +394,6 @@ class TestDegradationRecovery:
         assert record is not None
         assert record.health == DecoyHealth.DEGRADED
 
-    @pytest.mark.asyncio
     async def test_degraded_recovery_attempt(self, orchestrator):
         """check_degraded() should attempt restart on degraded decoys past the retry window."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -478,7 +416,6 @@ class TestDegradationRecovery:
         record = orchestrator.get_decoy(1)
         assert record.health == DecoyHealth.ACTIVE
 
-    @pytest.mark.asyncio
     async def test_degraded_stays_degraded_on_failure(self, orchestrator):
         """If recovery attempt fails, decoy should remain DEGRADED."""
         decoy = FakeDecoy(decoy_id=1, name="test", port=9999)
@@ -9,15 +9,21 @@ from datetime import datetime
 
 import httpx
 import pytest
+import pytest_asyncio
 
 from squirrelops_home_sensor.decoys.credentials import (
     CredentialGenerator,
 )
 from squirrelops_home_sensor.decoys.types.base import DecoyConnectionEvent
 from squirrelops_home_sensor.decoys.types.dev_server import DevServerDecoy
+from tests.integration.conftest import wait_for_event
 
+# The shared HTTP client is bound to the session loop, so the tests that use
+# it must run there too.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def credentials():
     """Generate a standard set of planted credentials for the decoy."""
     gen = CredentialGenerator()
@@ -26,9 +32,13 @@ def credentials():
     return [env_cred, aws_cred]
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
 async def decoy(credentials):
-    """Start a dev server decoy on a random high port and yield it."""
+    """Start a dev server decoy on a random high port, shared by the module.
+
+    The emulator serves from its own thread, so one listener can answer
+    every test regardless of which event loop the test runs on.
+    """
     d = DevServerDecoy(
         decoy_id=1,
         name="test-dev-server",
@@ -41,12 +51,44 @@ async def decoy(credentials):
     await d.stop()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_url(decoy):
     """Return the base URL for the running decoy."""
     return f"http://{decoy.bind_address}:{decoy.port}"
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def client(base_url):
+    """Keep-alive HTTP client bound to the decoy, shared by the module."""
+    async with httpx.AsyncClient(base_url=base_url) as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def _reset_decoy_callback(decoy):
+    """Drop any on_connection callback a previous test installed."""
+    decoy.on_connection = None
+    yield
+    decoy.on_connection = None
+
+
+def _record_connections(decoy, events):
+    """Collect *decoy*'s connection events; the returned Event fires on each.
+
+    The emulator calls on_connection from its server thread, so the Event is
+    set via the test's loop rather than directly.
+    """
+    loop = asyncio.get_running_loop()
+    evt = asyncio.Event()
+
+    def _on_connection(event):
+        events.append(event)
+        loop.call_soon_threadsafe(evt.set)
+
+    decoy.on_connection = _on_connection
+    return evt
+
+
 # ---------------------------------------------------------------------------
 # HTTP listener starts and stops
 # ---------------------------------------------------------------------------
@@ -54,17 +96,14 @@ def base_url(decoy):
 class TestDevServerLifecycle:
     """Decoy must start, serve HTTP, and stop cleanly."""
 
-    @pytest.mark.asyncio
     async def test_is_running_after_start(self, decoy):
         """Decoy should report running after start()."""
         assert decoy.is_running is True
 
-    @pytest.mark.asyncio
     async def test_health_check_passes(self, decoy):
         """health_check() should return True when running."""
         assert await decoy.health_check() is True
 
-    @pytest.mark.asyncio
     async def test_stop_shuts_down(self, credentials):
         """After stop(), the decoy should no longer be running."""
         d = DevServerDecoy(
@@ -78,12 +117,10 @@ class TestDevServerLifecycle:
         await d.stop()
         assert d.is_running is False
 
-    @pytest.mark.asyncio
-    async def test_http_reachable(self, decoy, base_url):
+    async def test_http_reachable(self, decoy, client):
         """The decoy should accept HTTP connections."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{base_url}/")
-            assert resp.status_code in (200, 500)  # React error page returns 500
+        resp = await client.get("/")
+        assert resp.status_code in (200, 500)  # React error page returns 500
 
 
 # ---------------------------------------------------------------------------
@@ -93,16 +130,14 @@ class TestDevServerLifecycle:
 class TestExpressBanner:
     """Responses should mimic an Express/Next.js development server."""
 
-    @pytest.mark.asyncio
-    async def test_server_header(self, decoy, base_url):
+    async def test_server_header(self, decoy, client):
         """Response should include an Express-like server header."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{base_url}/")
-            # Should have X-Powered-By: Express or similar
-            powered_by = resp.headers.get("x-powered-by", "")
-            assert "Express" in powered_by or "Next.js" in powered_by, (
-                f"Expected Express/Next.js banner, got X-Powered-By: {powered_by}"
-            )
+        resp = await client.get("/")
+        # Should have X-Powered-By: Express or similar
+        powered_by = resp.headers.get("x-powered-by", "")
+        assert "Express" in powered_by or "Next.js" in powered_by, (
+            f"Expected Express/Next.js banner, got X-Powered-By: {powered_by}"
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -112,21 +147,17 @@ class TestExpressBanner:
 class TestRootRoute:
     """GET / should return a React development error page."""
 
-    @pytest.mark.asyncio
-    async def test_root_returns_html(self, decoy, base_url):
+    async def test_root_returns_html(self, decoy, client):
         """Root route should return HTML content."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{base_url}/")
-            assert "text/html" in resp.headers.get("content-type", "")
+        resp = await client.get("/")
+        assert "text/html" in resp.headers.get("content-type", "")
 
-    @pytest.mark.asyncio
-    async def test_root_contains_react_markers(self, decoy, base_url):
+    async def test_root_contains_react_markers(self, decoy, client):
         """HTML should contain React/Next.js development markers."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{base_url}/")
-            body = resp.text.lower()
-            # Should reference react or next.js in the error page
-            assert "react" in body or "next" in body or "__next" in body
+        resp = await client.get("/")
+        body = resp.text.lower()
+        # Should reference react or next.js in the error page
+        assert "react" in body or "next" in body or "__next" in body
 
 
 # ---------------------------------------------------------------------------
@@ -136,19 +167,15 @@ class TestRootRoute:
 class TestApiHealthRoute:
     """GET /api/health should return a JSON health response."""
 
-    @pytest.mark.asyncio
-    async def test_returns_json(self, decoy, base_url):
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{base_url}/api/health")
-            assert resp.status_code == 200
-            assert "application/json" in resp.headers.get("content-type", "")
+    async def test_returns_json(self, decoy, client):
+        resp = await client.get("/api/health")
+        assert resp.status_code == 200
+        assert "application/json" in resp.headers.get("content-type", "")
 
-    @pytest.mark.asyncio
-    async def test_has_status_field(self, decoy, base_url):
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{base_url}/api/health")
-            data = resp.json()
-            assert "status" in data
+    async def test_has_status_field(self, decoy, client):
+        resp = await client.get("/api/health")
+        data = resp.json()
+        assert "status" in data
 
 
 # ---------------------------------------------------------------------------
@@ -158,22 +185,18 @@ class TestApiHealthRoute:
 class TestEnvRoute:
     """GET /.env should return planted .env file credentials."""
 
-    @pytest.mark.asyncio
-    async def test_returns_env_content(self, decoy, base_url):
+    async def test_returns_env_content(self, decoy, client):
         """/.env should serve the planted .env file contents."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{base_url}/.env")
-            assert resp.status_code == 200
-            body = resp.text
-            # Should contain env variable patterns
-            assert "=" in body
+        resp = await client.get("/.env")
+        assert resp.status_code == 200
+        body = resp.text
+        # Should contain env variable patterns
+        assert "=" in body
 
-    @pytest.mark.asyncio
-    async def test_content_type_is_text(self, decoy, base_url):
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{base_url}/.env")
-            content_type = resp.headers.get("content-type", "")
-            assert "text" in content_type
+    async def test_content_type_is_text(self, decoy, client):
+        resp = await client.get("/.env")
+        content_type = resp.headers.get("content-type", "")
+        assert "text" in content_type
 
 
 # ---------------------------------------------------------------------------
@@ -183,17 +206,14 @@ class TestEnvRoute:
 class TestConnectionLogging:
     """Every connection should trigger the on_connection callback."""
 
-    @pytest.mark.asyncio
-    async def test_connection_callback_fired(self, decoy, base_url):
+    async def test_connection_callback_fired(self, decoy, client):
         """Accessing any route should invoke the connection callback."""
         events: list[DecoyConnectionEvent] = []
-        decoy.on_connection = lambda e: events.append(e)
+        connected = _record_connections(decoy, events)
 
-        async with httpx.AsyncClient() as client:
-            await client.get(f"{base_url}/api/health")
+        await client.get("/api/health")
 
-        # Allow time for the callback to be invoked (thread -> async boundary)
-        await asyncio.sleep(0.2)
+        await wait_for_event(connected)
 
         assert len(events) >= 1
         event = events[0]
@@ -202,16 +222,14 @@ class TestConnectionLogging:
         assert event.protocol == "tcp"
         assert event.request_path == "/api/health"
 
-    @pytest.mark.asyncio
-    async def test_connection_event_has_timestamp(self, decoy, base_url):
+    async def test_connection_event_has_timestamp(self, decoy, client):
         """Connection events should include a UTC timestamp."""
         events: list[DecoyConnectionEvent] = []
-        decoy.on_connection = lambda e: events.append(e)
+        connected = _record_connections(decoy, events)
 
-        async with httpx.AsyncClient() as client:
-            await client.get(f"{base_url}/")
+        await client.get("/")
 
-        await asyncio.sleep(0.2)
+        await wait_for_event(connected)
 
         assert len(events) >= 1
         assert isinstance(events[0].timestamp, datetime)
@@ -224,37 +242,33 @@ class TestConnectionLogging:
 class TestCredentialDetection:
     """Decoy should detect when planted credentials appear in requests."""
 
-    @pytest.mark.asyncio
-    async def test_credential_in_auth_header(self, decoy, base_url, credentials):
+    async def test_credential_in_auth_header(self, decoy, client, credentials):
         """Sending a planted credential in Authorization header should be detected."""
         events: list[DecoyConnectionEvent] = []
-        decoy.on_connection = lambda e: events.append(e)
+        connected = _record_connections(decoy, events)
 
         # Use the AWS key as a Bearer token
         aws_cred = next(c for c in credentials if c.credential_type == "aws_key")
-        async with httpx.AsyncClient() as client:
-            await client.get(
-                f"{base_url}/api/health",
-                headers={"Authorization": f"Bearer {aws_cred.credential_value}"},
-            )
+        await client.get(
+            "/api/health",
+            headers={"Authorization": f"Bearer {aws_cred.credential_value}"},
+        )
 
-        await asyncio.sleep(0.2)
+        await wait_for_event(connected)
 
         assert len(events) >= 1
         cred_events = [e for e in events if e.credential_used is not None]
         assert len(cred_events) >= 1
         assert cred_events[0].credential_used == aws_cred.credential_value
 
-    @pytest.mark.asyncio
-    async def test_no_credential_when_none_sent(self, decoy, base_url):
+    async def test_no_credential_when_none_sent(self, decoy, client):
         """Normal requests without planted creds should have credential_used=None."""
         events: list[DecoyConnectionEvent] = []
-        decoy.on_connection = lambda e: events.append(e)
+        connected = _record_connections(decoy, events)
 
-        async with httpx.AsyncClient() as client:
-            await client.get(f"{base_url}/api/health")
+        await client.get("/api/health")
 
-        await asyncio.sleep(0.2)
+        await wait_for_event(connected)
 
         assert len(events) >= 1
         assert events[0].credential_used is None
@@ -10,7 +10,6 @@ import pathlib
 import aiosqlite
 import pytest
 
-from squirrelops_home_sensor.db.migrations import apply_migrations
 from squirrelops_home_sensor.devices.classifier import DeviceClassifier
 from squirrelops_home_sensor.devices.manager import DeviceManager, ScanResult
 from squirrelops_home_sensor.devices.signatures import SignatureDB
@@ -25,17 +24,6 @@ SIGNATURES_PATH = SENSOR_ROOT / "signatures" / "device_signatures.json"
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-async def db():
-    """In-memory SQLite with full schema applied."""
-    conn = await aiosqlite.connect(":memory:")
-    conn.row_factory = aiosqlite.Row
-    await conn.execute("PRAGMA foreign_keys = ON")
-    await apply_migrations(conn)
-    yield conn
-    await conn.close()
-
-
 @pytest.fixture
 def event_log(db: aiosqlite.Connection) -> EventLog:
     return EventLog(db)
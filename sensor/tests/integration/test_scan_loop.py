@@ -43,16 +43,6 @@ SIGNATURES_PATH = SENSOR_ROOT / "signatures" / "device_signatures.json"
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-async def db():
-    conn = await aiosqlite.connect(":memory:")
-    conn.row_factory = aiosqlite.Row
-    await conn.execute("PRAGMA foreign_keys = ON")
-    await apply_migrations(conn)
-    yield conn
-    await conn.close()
-
-
 @pytest.fixture
 def event_log(db: aiosqlite.Connection) -> EventLog:
     return EventLog(db)
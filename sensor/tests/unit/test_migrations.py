@@ -550,3 +550,38 @@ class TestMigrationV8:
         assert row is not None
 
         await db.close()
+
+
+class TestMigrationV9:
+    """Test V9 migration: indexes for the retention purge predicates."""
+
+    @pytest.mark.asyncio
+    async def test_v9_creates_retention_indexes(self, tmp_path) -> None:
+        """V9 migration indexes every column the retention purge filters on."""
+        db = await aiosqlite.connect(str(tmp_path / "test.db"))
+        await apply_migrations(db)
+
+        cursor = await db.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' "
+            "AND name IN ('idx_conn_timestamp', 'idx_canary_observed', 'idx_incidents_closed')"
+        )
+        rows = await cursor.fetchall()
+        assert len(rows) == 3
+
+        await db.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_incident_purge_uses_partial_index(self, tmp_path) -> None:
+        """The closed-incident purge predicate is served by the partial index."""
+        db = await aiosqlite.connect(str(tmp_path / "test.db"))
+        await apply_migrations(db)
+
+        cursor = await db.execute(
+            "EXPLAIN QUERY PLAN DELETE FROM incidents "
+            "WHERE status = 'closed' AND closed_at < ?",
+            ("2026-01-01T00:00:00.000Z",),
+        )
+        plan = " ".join(row[3] for row in await cursor.fetchall())
+        assert "idx_incidents_closed" in plan
+
+        await db.close()
@@ -59,7 +59,7 @@ class TestEvaluateDevicePorts:
     def test_empty_ports_produces_no_findings(self):
         """An empty set of ports should produce no findings."""
         findings = evaluate_device_ports(frozenset(), "smart_speaker")
-        assert findings == []
+        assert len(findings) == 0
 
     def test_multiple_risky_ports_produce_multiple_findings(self):
         """Multiple risky ports should each produce their own finding."""
@@ -81,3 +81,10 @@ class TestEvaluateDevicePorts:
         assert smart_home_findings[0].port == 3389
         assert smart_home_findings[0].service_name == "Remote Desktop (RDP)"
         assert smart_home_findings[0].severity == Severity.HIGH
+
+    def test_findings_follow_knowledge_base_order(self):
+        """Findings are ordered always-risky first, then context rules, then admin ports."""
+        findings = evaluate_device_ports(
+            frozenset({8080, 554, 22, 21, 23, 80}), "unknown"
+        )
+        assert [f.port for f in findings] == [23, 21, 22, 554, 80, 8080]
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import ipaddress
+import itertools
+import os
 from pathlib import Path
 
 import pytest
@@ -103,6 +105,9 @@ class TestGenerateCA:
 # TestGenerateServerCert
 # ---------------------------------------------------------------------------
 
+# Deterministic serials keep these tests off the OS entropy pool.
+_serials = itertools.count(1)
+
 
 class TestGenerateServerCert:
     """Verify server certificate properties."""
@@ -111,44 +116,53 @@ class TestGenerateServerCert:
     def ca_pair(self) -> tuple[EllipticCurvePrivateKey, x509.Certificate]:
         return generate_ca("TestSensor")
 
-    def test_returns_ec_key(
+    @pytest.fixture
+    def server_pair(
         self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+    ) -> tuple[EllipticCurvePrivateKey, x509.Certificate]:
+        """Server key and certificate issued by ``ca_pair`` with a counter serial."""
+        return generate_server_cert(*ca_pair, serial_number=next(_serials))
+
+    def test_returns_ec_key(
+        self, server_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
     ) -> None:
-        server_key, _ = generate_server_cert(*ca_pair)
+        server_key, _ = server_pair
         assert isinstance(server_key, EllipticCurvePrivateKey)
 
     def test_returns_x509_certificate(
-        self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+        self, server_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
     ) -> None:
-        _, server_cert = generate_server_cert(*ca_pair)
+        _, server_cert = server_pair
         assert isinstance(server_cert, x509.Certificate)
 
     def test_not_a_ca(
-        self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+        self, server_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
     ) -> None:
-        _, server_cert = generate_server_cert(*ca_pair)
+        _, server_cert = server_pair
         bc = server_cert.extensions.get_extension_for_class(x509.BasicConstraints)
         assert bc.value.ca is False
         assert bc.critical is True
 
     def test_subject_cn(
-        self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+        self, server_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
     ) -> None:
-        _, server_cert = generate_server_cert(*ca_pair)
+        _, server_cert = server_pair
         cn = server_cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value
         assert cn == "SquirrelOps Sensor"
 
     def test_issuer_is_ca(
-        self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+        self,
+        ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate],
+        server_pair: tuple[EllipticCurvePrivateKey, x509.Certificate],
     ) -> None:
-        ca_key, ca_cert = ca_pair
-        _, server_cert = generate_server_cert(ca_key, ca_cert)
+        _, ca_cert = ca_pair
+        _, server_cert = server_pair
         assert server_cert.issuer == ca_cert.subject
 
     def test_san_contains_localhost(
-        self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+        self, server_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
     ) -> None:
-        _, server_cert = generate_server_cert(*ca_pair)
+        _, server_cert = server_pair
         san = server_cert.extensions.get_extension_for_class(
             x509.SubjectAlternativeName
         )
@@ -156,9 +170,9 @@ class TestGenerateServerCert:
         assert "localhost" in dns_names
 
     def test_san_contains_ipv4_addresses(
-        self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+        self, server_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
     ) -> None:
-        _, server_cert = generate_server_cert(*ca_pair)
+        _, server_cert = server_pair
         san = server_cert.extensions.get_extension_for_class(
             x509.SubjectAlternativeName
         )
@@ -167,17 +181,19 @@ class TestGenerateServerCert:
         assert ipaddress.IPv4Address("0.0.0.0") in ip_addrs
 
     def test_ten_year_validity(
-        self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+        self, server_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
     ) -> None:
-        _, server_cert = generate_server_cert(*ca_pair)
+        _, server_cert = server_pair
         delta = server_cert.not_valid_after_utc - server_cert.not_valid_before_utc
         assert 3649 <= delta.days <= 3650
 
     def test_signed_by_ca(
-        self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+        self,
+        ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate],
+        server_pair: tuple[EllipticCurvePrivateKey, x509.Certificate],
     ) -> None:
-        ca_key, ca_cert = ca_pair
-        _, server_cert = generate_server_cert(ca_key, ca_cert)
+        _, ca_cert = ca_pair
+        _, server_cert = server_pair
         # Verify the CA public key can validate the server cert signature
         ca_cert.public_key().verify(
             server_cert.signature,
@@ -186,15 +202,30 @@ class TestGenerateServerCert:
         )
 
     def test_server_key_differs_from_ca_key(
-        self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+        self,
+        ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate],
+        server_pair: tuple[EllipticCurvePrivateKey, x509.Certificate],
     ) -> None:
-        ca_key, ca_cert = ca_pair
-        server_key, _ = generate_server_cert(ca_key, ca_cert)
+        ca_key, _ = ca_pair
+        server_key, _ = server_pair
         from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
         server_pub = server_key.public_key().public_bytes(Encoding.PEM, PublicFormat.SubjectPublicKeyInfo)
         ca_pub = ca_key.public_key().public_bytes(Encoding.PEM, PublicFormat.SubjectPublicKeyInfo)
         assert server_pub != ca_pub
 
+    def test_explicit_serial_number(
+        self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+    ) -> None:
+        _, server_cert = generate_server_cert(*ca_pair, serial_number=4242)
+        assert server_cert.serial_number == 4242
+
+    def test_default_serial_number_is_random(
+        self, ca_pair: tuple[EllipticCurvePrivateKey, x509.Certificate]
+    ) -> None:
+        _, first = generate_server_cert(*ca_pair)
+        _, second = generate_server_cert(*ca_pair)
+        assert first.serial_number != second.serial_number
+
 
 # ---------------------------------------------------------------------------
 # TestEnsureTlsCerts
@@ -256,6 +287,16 @@ class TestEnsureTlsCerts:
         mode = key_path.stat().st_mode & 0o777
         assert mode == 0o600
 
+    async def test_existing_key_file_permissions_are_tightened(
+        self, store: _InMemoryStore, tmp_path: Path
+    ) -> None:
+        stale = tmp_path / "server.key"
+        stale.write_text("stale")
+        stale.chmod(0o644)
+        _, key_path, _, _ = await ensure_tls_certs(store, tmp_path, "TestSensor")
+        assert key_path.stat().st_mode & 0o777 == 0o600
+        assert "PRIVATE KEY" in key_path.read_text()
+
     async def test_returns_ca_key_and_cert(
         self, store: _InMemoryStore, tmp_path: Path
     ) -> None:
@@ -308,6 +349,25 @@ class TestEnsureTlsCerts:
         assert cert_path.exists()
         assert key_path.exists()
 
+    async def test_second_call_skips_unchanged_pem_files(
+        self, store: _InMemoryStore, tmp_path: Path
+    ) -> None:
+        cert_path, _, _, _ = await ensure_tls_certs(store, tmp_path, "TestSensor")
+        os.utime(cert_path, ns=(0, 0))
+
+        await ensure_tls_certs(store, tmp_path, "TestSensor")
+        assert cert_path.stat().st_mtime_ns == 0
+
+    async def test_second_call_rewrites_modified_pem_files(
+        self, store: _InMemoryStore, tmp_path: Path
+    ) -> None:
+        cert_path, _, _, _ = await ensure_tls_certs(store, tmp_path, "TestSensor")
+        expected = cert_path.read_text()
+        cert_path.write_text("corrupted")
+
+        await ensure_tls_certs(store, tmp_path, "TestSensor")
+        assert cert_path.read_text() == expected
+
     async def test_creates_data_dir_if_missing(
         self, store: _InMemoryStore, tmp_path: Path
     ) -> None: